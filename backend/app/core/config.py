@@ -81,6 +81,11 @@ class Settings(BaseSettings):
     # LLM Provider Selection
     LLM_PROVIDER: str = "gemini"  # Options: "gemini" or "groq"
 
+    # Exact-match prompt cache for Groq (identical messages reuse the previous response).
+    # Off by default: replaying responses is only right for deterministic, tool-free prompts.
+    ENABLE_LLM_CACHE: bool = False
+    LLM_CACHE_MAXSIZE: int = 1000
+
     # ========================================
     # LangSmith Tracing Configuration
     # ========================================
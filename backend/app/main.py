@@ -66,6 +66,15 @@ async def startup_event():
     logger = get_logger(__name__)
     logger.info("🚀 Application starting up...")
 
+    # Import LLM providers now so the first chat request doesn't pay for it
+    from app.services.llm_manager import LLMServiceError, llm_manager
+
+    try:
+        llm_manager.initialize()
+    except LLMServiceError as e:
+        # Keep serving /health; the first chat request retries and reports the error
+        logger.error("❌ LLM provider not initialized at startup: %s", e)
+
     # NOTE: With Google Embeddings API, no background model loading is needed
     # The API is instant and ready to use immediately
 
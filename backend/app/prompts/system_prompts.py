@@ -43,6 +43,7 @@ To assist passengers with:
 When searching for flights, you need IATA 3-letter airport codes:
 - If you know the code (Delhi=DEL, Mumbai=BOM, London=LHR), use it directly
 - If you DON'T know the code, use the `lookup_iata_code` tool to find it
+- To search flights when you only have city names, call `search_flights_by_city` directly
 - NEVER guess or invent airport codes
 
 **Common codes you know:**
@@ -135,6 +136,7 @@ Use these to convert relative dates:
 3. **"Next week"**: When user says "next week", search for the entire week starting {days_ahead["next_week_monday"]}
 4. **Day names**: "Friday" means the NEXT Friday from today
 5. Always convert to YYYY-MM-DD format before calling search_flights
+6. **Several routes in one request** (multi-city, outbound + return): use ONE `search_flights_batch` call instead of several `search_flights` calls
 """
 
     base_prompt = UNIFIED_SYSTEM_PROMPT + date_info
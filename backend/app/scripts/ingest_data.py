@@ -20,7 +20,7 @@ setup_logging()
 logger = get_logger(__name__)
 
 
-def main():
+async def main():
     logger.info("Starting data ingestion...")
 
     # Path to policies
@@ -35,10 +35,13 @@ def main():
 
     try:
         service = VectorService()
-        # ingestion in langchan-postgres might be sync or async depending on implementation
-        # PGVector.add_documents is typically sync in recent versions or handles async internally via run_in_executor
-        # We'll run it directly.
-        service.ingest_data(policies_dir)
+        # Upload several batches concurrently (PGVector itself runs in sync mode)
+        result = await service.aingest_data(policies_dir)
+        if not result.complete:
+            raise RuntimeError(
+                f"only {result.stored}/{result.expected} chunks stored, "
+                f"failed batches: {result.failed_batches}"
+            )
         logger.info("Data ingestion finished successfully.")
 
     except Exception as e:
@@ -47,4 +50,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -5,6 +5,7 @@ This service integrates with Amadeus Flight Offers Search API to provide
 real-time flight data with automatic fallback to mock data.
 """
 
+import asyncio
 from datetime import datetime, timedelta
 
 from amadeus import Client, ResponseError
@@ -103,8 +104,11 @@ class AmadeusFlightAPI:
 
         try:
             # Call Amadeus Flight Offers Search API
-            # Filter by Air India (AI) to only show our flights
-            response = self.client.shopping.flight_offers_search.get(
+            # Filter by Air India (AI) to only show our flights.
+            # The SDK is blocking, so it runs in a worker thread to keep the event loop free
+            # and let concurrent searches (e.g. search_flights_batch) overlap.
+            response = await asyncio.to_thread(
+                self.client.shopping.flight_offers_search.get,
                 originLocationCode=origin.upper(),
                 destinationLocationCode=destination.upper(),
                 departureDate=departure_date,
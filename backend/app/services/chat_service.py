@@ -23,6 +23,15 @@ from app.tools import ALL_TOOLS
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Returned to the model when a tool raises; exception details stay in the logs
+TOOL_ERROR_MESSAGE = "The {tool} tool failed unexpectedly. Please try again later."
+
+
+def _tool_error_output(tool_name: str) -> str:
+    """Log the active tool exception and return a message that is safe to show the model"""
+    logger.exception("❌ Tool %s failed", tool_name)
+    return TOOL_ERROR_MESSAGE.format(tool=tool_name)
+
 
 class ChatService:
     """Service for handling chat interactions with RAG and tool support"""
@@ -146,9 +155,8 @@ class ChatService:
                                     tool_output = tool.invoke(tool_args)
                                     logger.info(f"✅ Tool {tool_name} executed successfully")
                                     logger.debug(f"Tool output: {str(tool_output)[:200]}...")
-                            except Exception as e:
-                                logger.error(f"❌ Tool {tool_name} failed: {str(e)}")
-                                tool_output = f"Error executing tool: {str(e)}"
+                            except Exception:
+                                tool_output = _tool_error_output(tool_name)
                             break
 
                     # Add tool result to messages
@@ -288,9 +296,8 @@ class ChatService:
                                     elif hasattr(tool, "invoke"):
                                         tool_output = tool.invoke(tool_args)
                                     logger.info(f"✅ Tool {tool_name} executed")
-                                except Exception as e:
-                                    logger.error(f"❌ Tool {tool_name} failed: {e}")
-                                    tool_output = f"Error: {str(e)}"
+                                except Exception:
+                                    tool_output = _tool_error_output(tool_name)
                                 break
 
                         messages.append(
@@ -5,6 +5,7 @@ Provides flight search functionality with Amadeus API integration
 and automatic fallback to mock data.
 """
 
+from functools import cache, lru_cache
 import os
 
 from app.models.flight import Flight
@@ -15,12 +16,47 @@ from data.flight_data import FLIGHTS_DB, normalize_location
 logger = get_logger(__name__)
 
 
+def _canonical_flight_number(flight_number: str) -> str:
+    """Normalize a flight number for lookups ("ai 865 " -> "AI865")"""
+    return flight_number.upper().replace(" ", "")
+
+
+@lru_cache(maxsize=1024)
+def _format_flight(
+    flight_number: str,
+    origin_city: str,
+    origin: str,
+    destination_city: str,
+    destination: str,
+    departure_time: str,
+    arrival_time: str,
+    duration: str,
+    aircraft: str,
+    price_economy: int,
+    price_business: int,
+) -> str:
+    """Render one flight; keyed on every displayed field so API results cache safely"""
+    return (
+        f"✈️ **{flight_number}** - {origin_city} ({origin}) "
+        f"→ {destination_city} ({destination})\n"
+        f"   ⏰ {departure_time} - {arrival_time} ({duration})\n"
+        f"   💺 {aircraft}\n"
+        f"   💰 Economy: ₹{price_economy:,} | Business: ₹{price_business:,}"
+    )
+
+
 class FlightService:
     """Service for searching flights with API integration and fallback"""
 
     def __init__(self):
         self.amadeus_api = get_amadeus_api()
         self.flights_db = FLIGHTS_DB
+        # Canonical flight number ("AI865") -> flight record, built once
+        self._by_number = {_canonical_flight_number(f["flight_number"]): f for f in self.flights_db}
+        # (origin, destination) -> flights sorted by departure time, built once
+        self._by_route: dict[tuple[str, str], list[dict]] = {}
+        for flight in sorted(self.flights_db, key=lambda f: f["departure_time"]):
+            self._by_route.setdefault((flight["origin"], flight["destination"]), []).append(flight)
         self.use_real_api = os.getenv("USE_REAL_FLIGHT_API", "true").lower() == "true"
 
         logger.info(
@@ -55,7 +91,7 @@ class FlightService:
         origin_code = normalize_location(origin)
         destination_code = normalize_location(destination)
 
-        logger.info(f"🔍 Searching flights: {origin_code} → {destination_code}, date={date}")
+        logger.info("🔍 Searching flights: %s → %s, date=%s", origin_code, destination_code, date)
 
         # Try real API first
         if self.use_real_api and self.amadeus_api.is_configured():
@@ -69,7 +105,7 @@ class FlightService:
                 )
 
                 if flights:
-                    logger.info(f"✅ Found {len(flights)} flights from Amadeus API")
+                    logger.info("✅ Found %d flights from Amadeus API", len(flights))
                     return flights
                 else:
                     logger.warning("⚠️ Amadeus API returned no flights, using mock data")
@@ -78,7 +114,7 @@ class FlightService:
                 logger.error(f"❌ Amadeus API failed: {e}, falling back to mock data")
 
         # Fallback to mock data
-        logger.info(f"📦 Using mock data for {origin_code} → {destination_code}")
+        logger.info("📦 Using mock data for %s → %s", origin_code, destination_code)
         return self._search_mock_flights(origin_code, destination_code, max_results)
 
     def _search_mock_flights(
@@ -95,43 +131,20 @@ class FlightService:
         Returns:
             List of Flight objects
         """
-        # Filter flights by route
-        matching_flights = [
-            flight
-            for flight in self.flights_db
-            if flight["origin"] == origin and flight["destination"] == destination
-        ]
+        # Route index is pre-sorted by departure time
+        matching_flights = self._by_route.get((origin, destination))
 
         if not matching_flights:
-            logger.info(f"❌ No mock data for route {origin} → {destination}")
+            logger.info("❌ No mock data for route %s → %s", origin, destination)
             return []
 
-        # Sort by departure time
-        matching_flights.sort(key=lambda f: f["departure_time"])
-
         # Limit results
         results = matching_flights[:max_results]
 
         # Convert to Flight objects
-        flights = []
-        for flight_data in results:
-            flight = Flight(
-                flight_number=flight_data["flight_number"],
-                origin=flight_data["origin"],
-                origin_city=flight_data["origin_city"],
-                destination=flight_data["destination"],
-                destination_city=flight_data["destination_city"],
-                departure_time=flight_data["departure_time"],
-                arrival_time=flight_data["arrival_time"],
-                duration=flight_data["duration"],
-                aircraft=flight_data["aircraft"],
-                price_economy=flight_data["price_economy"],
-                price_business=flight_data["price_business"],
-                available_seats=9,  # Default
-            )
-            flights.append(flight)
-
-        logger.info(f"📦 Found {len(flights)} mock flights")
+        flights = [self._to_flight(flight_data) for flight_data in results]
+
+        logger.info("📦 Found %d mock flights", len(flights))
         return flights
 
     def get_flight_by_number(self, flight_number: str) -> Flight | None:
@@ -144,35 +157,41 @@ class FlightService:
         Returns:
             Flight object or None
         """
-        flight_number = flight_number.upper().strip()
-
-        for flight_data in self.flights_db:
-            if flight_data["flight_number"].upper() == flight_number:
-                return Flight(
-                    flight_number=flight_data["flight_number"],
-                    origin=flight_data["origin"],
-                    origin_city=flight_data["origin_city"],
-                    destination=flight_data["destination"],
-                    destination_city=flight_data["destination_city"],
-                    departure_time=flight_data["departure_time"],
-                    arrival_time=flight_data["arrival_time"],
-                    duration=flight_data["duration"],
-                    aircraft=flight_data["aircraft"],
-                    price_economy=flight_data["price_economy"],
-                    price_business=flight_data["price_business"],
-                    available_seats=9,  # Default
-                )
-
-        return None
+        flight_data = self._by_number.get(_canonical_flight_number(flight_number))
+        return self._to_flight(flight_data) if flight_data else None
+
+    @staticmethod
+    def _to_flight(flight_data: dict) -> Flight:
+        """Convert a mock flight record into a Flight object"""
+        return Flight(
+            flight_number=flight_data["flight_number"],
+            origin=flight_data["origin"],
+            origin_city=flight_data["origin_city"],
+            destination=flight_data["destination"],
+            destination_city=flight_data["destination_city"],
+            departure_time=flight_data["departure_time"],
+            arrival_time=flight_data["arrival_time"],
+            duration=flight_data["duration"],
+            aircraft=flight_data["aircraft"],
+            price_economy=flight_data["price_economy"],
+            price_business=flight_data["price_business"],
+            available_seats=9,  # Default
+        )
 
     def format_flight_for_display(self, flight: Flight) -> str:
         """Format a single flight for display"""
-        return (
-            f"✈️ **{flight.flight_number}** - {flight.origin_city} ({flight.origin}) "
-            f"→ {flight.destination_city} ({flight.destination})\n"
-            f"   ⏰ {flight.departure_time} - {flight.arrival_time} ({flight.duration})\n"
-            f"   💺 {flight.aircraft}\n"
-            f"   💰 Economy: ₹{flight.price_economy:,} | Business: ₹{flight.price_business:,}"
+        return _format_flight(
+            flight.flight_number,
+            flight.origin_city,
+            flight.origin,
+            flight.destination_city,
+            flight.destination,
+            flight.departure_time,
+            flight.arrival_time,
+            flight.duration,
+            flight.aircraft,
+            flight.price_economy,
+            flight.price_business,
         )
 
     def format_flights_list(self, flights: list[Flight]) -> str:
@@ -180,20 +199,16 @@ class FlightService:
         if not flights:
             return "No flights found for this route."
 
-        output = f"Found {len(flights)} flight(s):\n\n"
-        for flight in flights:
-            output += self.format_flight_for_display(flight) + "\n\n"
-
-        return output.strip()
-
-
-# Singleton instance
-_flight_service: FlightService | None = None
+        body = "\n\n".join(self.format_flight_for_display(flight) for flight in flights)
+        return f"Found {len(flights)} flight(s):\n\n{body}"
 
 
+@cache
 def get_flight_service() -> FlightService:
-    """Get the global FlightService instance"""
-    global _flight_service
-    if _flight_service is None:
-        _flight_service = FlightService()
-    return _flight_service
+    """
+    Get the global FlightService instance
+
+    Cached so the service (and its Amadeus client) is built once; use
+    ``get_flight_service.cache_clear()`` to reset it in tests.
+    """
+    return FlightService()
@@ -5,6 +5,8 @@ This service provides a centralized interface for interacting with Google's Gemi
 It handles configuration, error handling, logging, and automatic model fallback.
 """
 
+from collections.abc import Callable
+from functools import lru_cache
 import logging
 import os
 from typing import Any
@@ -14,9 +16,25 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 
 from app.core.config import get_settings
 
+try:
+    from google.api_core import exceptions as gexc
+
+    # Quota / rate-limit errors that should silently rotate to the next combination
+    _QUOTA_ERRORS: tuple[type[Exception], ...] = (gexc.ResourceExhausted, gexc.TooManyRequests)
+except ImportError:  # pragma: no cover - google-api-core ships with langchain-google-genai
+    _QUOTA_ERRORS = ()
+
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Configure LangSmith tracing once at import (settings are static)
+if settings.is_tracing_enabled:
+    os.environ["LANGSMITH_TRACING"] = "true"
+    os.environ["LANGSMITH_API_KEY"] = settings.LANGSMITH_API_KEY or ""
+    os.environ["LANGSMITH_PROJECT"] = settings.LANGSMITH_PROJECT
+    os.environ["LANGSMITH_ENDPOINT"] = settings.LANGSMITH_ENDPOINT
+    logger.info("🔍 LangSmith tracing enabled for Gemini")
+
 
 class LLMServiceError(Exception):
     """Custom exception for LLM service errors"""
@@ -24,6 +42,27 @@ class LLMServiceError(Exception):
     pass
 
 
+@lru_cache(maxsize=64)
+def _get_chat_model(
+    model: str, api_key: str, temperature: float, max_tokens: int | None = None
+) -> ChatGoogleGenerativeAI:
+    """
+    Build a ChatGoogleGenerativeAI client once per (model, key, temperature, max_tokens).
+
+    Clients are stateless between calls, so rebuilding one per request only repeats
+    the key parsing and transport setup. Used for sync paths; streaming builds its own
+    so the async transport is created inside the running event loop.
+    """
+    return ChatGoogleGenerativeAI(  # type: ignore[call-arg]
+        model=model,
+        temperature=temperature,
+        max_output_tokens=max_tokens,
+        google_api_key=api_key,  # type: ignore[arg-type]
+        max_retries=0,  # Disable internal retries - let our fallback handle it
+        timeout=30,  # 30 second timeout per request
+    )
+
+
 def get_llm(
     temperature: float = 0.3, max_tokens: int | None = None, model_name: str | None = None
 ) -> ChatGoogleGenerativeAI:
@@ -40,21 +79,8 @@ def get_llm(
     Raises:
         LLMServiceError: If API key is missing or all models in pool fail
     """
-    # Configure LangSmith tracing if enabled
-    if settings.is_tracing_enabled:
-        os.environ["LANGSMITH_TRACING"] = "true"
-        os.environ["LANGSMITH_API_KEY"] = settings.LANGSMITH_API_KEY or ""
-        os.environ["LANGSMITH_PROJECT"] = settings.LANGSMITH_PROJECT
-        os.environ["LANGSMITH_ENDPOINT"] = settings.LANGSMITH_ENDPOINT
-        logger.info("🔍 LangSmith tracing enabled for Gemini")
-
-    # Build list of available API keys (fallback chain)
-    api_keys: list[tuple[str, str]] = []  # (key, description)
-
-    if settings.GOOGLE_API_KEY:
-        api_keys.append((settings.GOOGLE_API_KEY.strip(), "GOOGLE_API_KEY"))
-    if settings.GOOGLE_FALLBACK_API_KEY:
-        api_keys.append((settings.GOOGLE_FALLBACK_API_KEY.strip(), "GOOGLE_FALLBACK_API_KEY"))
+    # Available API keys (fallback chain)
+    api_keys = get_api_keys()
 
     if not api_keys:
         raise LLMServiceError(
@@ -64,21 +90,16 @@ def get_llm(
     # Determine which models to try
     models_to_try = [model_name] if model_name else settings.GEMINI_MODEL_POOL
 
-    # Try each API key, and for each key try each model
+    # Try each API key, and for each key try each model.
+    # Construction is local (no network round-trip), so a sequential probe is as fast as a
+    # concurrent one; quota/auth failures only surface on invoke, where the fallback lives.
     last_error: Exception | None = None
     for api_key, key_name in api_keys:
         for model in models_to_try:
             try:
-                logger.info(f"Attempting LLM init: {key_name} with model {model}")
-                llm = ChatGoogleGenerativeAI(
-                    model=model,
-                    temperature=temperature,
-                    max_output_tokens=max_tokens,
-                    google_api_key=api_key,  # type: ignore[arg-type]
-                    max_retries=0,  # Disable internal retries - let our fallback handle it
-                    timeout=30,  # 30 second timeout per request
-                )  # type: ignore
-                logger.info(f"✅ LLM initialized: {key_name}, model={model}")
+                logger.info("Attempting LLM init: %s with model %s", key_name, model)
+                llm = _get_chat_model(model, api_key, temperature, max_tokens)
+                logger.info("✅ LLM initialized: %s, model=%s", key_name, model)
                 return llm
             except Exception as e:
                 logger.warning(f"⚠️ {key_name} + model {model} failed: {str(e)}")
@@ -91,26 +112,31 @@ def get_llm(
     raise LLMServiceError(error_msg) from last_error
 
 
-def get_api_keys() -> list[tuple[str, str]]:
-    """Get list of available API keys for fallback chain."""
+@lru_cache(maxsize=1)
+def get_api_keys() -> tuple[tuple[str, str], ...]:
+    """
+    Get available API keys for fallback chain.
+
+    Cached since settings are static; call ``refresh_combinations()`` after a reload.
+    """
     api_keys: list[tuple[str, str]] = []
     if settings.GOOGLE_API_KEY:
         api_keys.append((settings.GOOGLE_API_KEY.strip(), "GOOGLE_API_KEY"))
     if settings.GOOGLE_FALLBACK_API_KEY:
         api_keys.append((settings.GOOGLE_FALLBACK_API_KEY.strip(), "GOOGLE_FALLBACK_API_KEY"))
-    return api_keys
+    return tuple(api_keys)
 
 
 # Global rotation index for round-robin distribution
 _rotation_index: int = 0
 
 
-def get_all_combinations() -> list[tuple[str, str, str, str]]:
+def _build_combinations() -> tuple[tuple[str, str, str, str], ...]:
     """
-    Get all model+API combinations for round-robin rotation.
+    Build all model+API combinations for round-robin rotation.
 
     Returns:
-        List of (model_name, api_key, key_name, combo_id) tuples
+        Tuple of (model_name, api_key, key_name, combo_id) tuples
         Ordered: Model1+API1, Model1+API2, Model2+API1, Model2+API2, ...
     """
     api_keys = get_api_keys()
@@ -124,7 +150,24 @@ def get_all_combinations() -> list[tuple[str, str, str, str]]:
             combo_id = f"{model} ({api_label})"
             combinations.append((model, api_key, key_name, combo_id))
 
-    return combinations
+    return tuple(combinations)
+
+
+# Precomputed once at import; the pool and keys are static configuration
+_COMBINATIONS = _build_combinations()
+
+
+def get_all_combinations() -> tuple[tuple[str, str, str, str], ...]:
+    """Get all model+API combinations for round-robin rotation (precomputed)."""
+    return _COMBINATIONS
+
+
+def refresh_combinations() -> None:
+    """Rebuild API keys and combinations after a settings reload."""
+    global _COMBINATIONS
+    get_api_keys.cache_clear()
+    _get_chat_model.cache_clear()
+    _COMBINATIONS = _build_combinations()
 
 
 def get_next_rotation_index(total_combinations: int) -> int:
@@ -167,17 +210,11 @@ def invoke_with_api_fallback(
 
         for api_key, key_name in api_keys:
             try:
-                logger.info(f"🔄 Trying {model_name} with {key_name}...")
-                llm_instance = ChatGoogleGenerativeAI(  # type: ignore[call-arg]
-                    model=model_name,
-                    temperature=temperature,
-                    google_api_key=api_key,  # type: ignore[arg-type]
-                    max_retries=0,
-                    timeout=30,
-                )
+                logger.info("🔄 Trying %s with %s...", model_name, key_name)
+                llm_instance = _get_chat_model(model_name, api_key, temperature)
                 llm: Any = llm_instance.bind_tools(tools) if tools else llm_instance
                 response = llm.invoke(messages)
-                logger.info(f"✅ Success with {model_name} + {key_name}")
+                logger.info("✅ Success with %s + %s", model_name, key_name)
                 return response
             except Exception as e:
                 logger.warning(f"⚠️ {model_name} + {key_name} failed: {e}")
@@ -185,6 +222,17 @@ def invoke_with_api_fallback(
         raise LLMServiceError(f"All API keys failed for model {model_name}")
 
     # Round-robin rotation mode
+    return _invoke_round_robin(lambda llm: llm.invoke(messages), temperature, tools)
+
+
+def _invoke_round_robin(
+    run: Callable[[Any], Any],
+    temperature: float,
+    tools: list | None,
+) -> Any:
+    """
+    Run ``run(llm)`` across the model/key rotation, falling back on errors.
+    """
     combinations = get_all_combinations()
     if not combinations:
         raise LLMServiceError("No API keys or models configured.")
@@ -193,7 +241,7 @@ def invoke_with_api_fallback(
     start_index = get_next_rotation_index(total)
     last_error: Exception | None = None
 
-    logger.info(f"🔄 Round-robin: Starting at position {start_index + 1}/{total}")
+    logger.info("🔄 Round-robin: Starting at position %d/%d", start_index + 1, total)
 
     # Try all combinations starting from the rotation index
     for i in range(total):
@@ -201,34 +249,20 @@ def invoke_with_api_fallback(
         model, api_key, key_name, combo_id = combinations[idx]
 
         try:
-            logger.info(f"🔄 [{idx + 1}/{total}] Trying {combo_id}...")
+            logger.info("🔄 [%d/%d] Trying %s...", idx + 1, total, combo_id)
 
-            llm_instance = ChatGoogleGenerativeAI(  # type: ignore[call-arg]
-                model=model,
-                temperature=temperature,
-                google_api_key=api_key,  # type: ignore[arg-type]
-                max_retries=0,
-                timeout=30,
-            )
-
-            llm = llm_instance.bind_tools(tools) if tools else llm_instance
+            llm_instance = _get_chat_model(model, api_key, temperature)
+            llm: Any = llm_instance.bind_tools(tools) if tools else llm_instance
 
-            response = llm.invoke(messages)
-            logger.info(f"✅ Success with {combo_id}")
+            response = run(llm)
+            logger.info("✅ Success with %s", combo_id)
             return response
 
         except Exception as e:
-            error_str = str(e)
-            error_type = type(e).__name__
-
-            if (
-                "429" in error_str
-                or "quota" in error_str.lower()
-                or "ResourceExhausted" in error_type
-            ):
+            if isinstance(e, _QUOTA_ERRORS):
                 logger.warning(f"⚠️ Quota exhausted for {combo_id}, trying next...")
             else:
-                logger.warning(f"⚠️ {combo_id} failed: {error_type}: {error_str[:100]}")
+                logger.warning(f"⚠️ {combo_id} failed: {type(e).__name__}: {str(e)[:100]}")
 
             last_error = e
             continue
@@ -269,7 +303,7 @@ async def astream_with_api_fallback(
     start_index = get_next_rotation_index(total)
     last_error: Exception | None = None
 
-    logger.info(f"🔄 Streaming round-robin: Starting at position {start_index + 1}/{total}")
+    logger.info("🔄 Streaming round-robin: Starting at position %d/%d", start_index + 1, total)
 
     # Try all combinations starting from the rotation index
     for i in range(total):
@@ -277,8 +311,9 @@ async def astream_with_api_fallback(
         model, api_key, key_name, combo_id = combinations[idx]
 
         try:
-            logger.info(f"🔄 Streaming [{idx + 1}/{total}]: Trying {combo_id}...")
+            logger.info("🔄 Streaming [%d/%d]: Trying %s...", idx + 1, total, combo_id)
 
+            # Built per stream (not _get_chat_model): the async client binds to this loop
             llm_instance = ChatGoogleGenerativeAI(  # type: ignore[call-arg]
                 model=model,
                 temperature=temperature,
@@ -294,21 +329,14 @@ async def astream_with_api_fallback(
                 yield chunk
 
             # If we got here without error, we're done
-            logger.info(f"✅ Streaming success with {combo_id}")
+            logger.info("✅ Streaming success with %s", combo_id)
             return
 
         except Exception as e:
-            error_str = str(e)
-            error_type = type(e).__name__
-
-            if (
-                "429" in error_str
-                or "quota" in error_str.lower()
-                or "ResourceExhausted" in error_type
-            ):
+            if isinstance(e, _QUOTA_ERRORS):
                 logger.warning(f"⚠️ Quota exhausted for {combo_id}, trying next...")
             else:
-                logger.warning(f"⚠️ Streaming failed {combo_id}: {error_type}: {error_str[:100]}")
+                logger.warning(f"⚠️ Streaming failed {combo_id}: {type(e).__name__}: {str(e)[:100]}")
 
             last_error = e
             continue
@@ -340,24 +368,25 @@ def chat_complete(
     try:
         llm = get_llm(temperature=temperature, max_tokens=max_tokens)
 
-        logger.info(f"Generating completion with {len(messages)} messages")
-        logger.debug(f"Messages: {[msg.type for msg in messages]}")
+        logger.info("Generating completion with %d messages", len(messages))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Messages: %s", [msg.type for msg in messages])
 
         # Invoke the LLM
         response = llm.invoke(messages)
 
         logger.info("Completion generated successfully")
-        logger.debug(f"Response length: {len(str(response.content))} chars")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response length: %d chars", len(str(response.content)))
 
-        # Handle response content which can be str or list
+        # Handle response content which can be str or list (str is the common case)
         content = response.content
-        if isinstance(content, str):
+        if type(content) is str:  # noqa: E721 - exact check, skips the MRO walk
             return content
-        elif isinstance(content, list):
+        if isinstance(content, list):
             # If content is a list, join string elements
-            return " ".join(str(item) for item in content if isinstance(item, str))
-        else:
-            return str(content)
+            return " ".join(item for item in content if isinstance(item, str))
+        return str(content)
 
     except LLMServiceError:
         # Re-raise our custom errors
@@ -367,6 +396,13 @@ def chat_complete(
         raise LLMServiceError(f"Failed to generate completion: {str(e)}") from e
 
 
+_ROLE_MESSAGES: dict[str, type[BaseMessage]] = {
+    "system": SystemMessage,
+    "user": HumanMessage,
+    "assistant": AIMessage,
+}
+
+
 def create_message(role: str, content: str) -> BaseMessage:
     """
     Create a message object for the LLM.
@@ -381,14 +417,13 @@ def create_message(role: str, content: str) -> BaseMessage:
     Raises:
         ValueError: If role is invalid
     """
-    if role == "system":
-        return SystemMessage(content=content)
-    elif role == "user":
-        return HumanMessage(content=content)
-    elif role == "assistant":
-        return AIMessage(content=content)
-    else:
-        raise ValueError(f"Invalid role: {role}. Must be 'system', 'user', or 'assistant'")
+    try:
+        message_cls = _ROLE_MESSAGES[role]
+    except KeyError:
+        raise ValueError(
+            f"Invalid role: {role}. Must be 'system', 'user', or 'assistant'"
+        ) from None
+    return message_cls(content=content)
 
 
 # =============================================================================
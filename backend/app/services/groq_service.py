@@ -5,10 +5,18 @@ This service provides integration with Groq's ultra-fast LLM API.
 Groq offers generous free tier quotas and extremely low latency.
 """
 
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from functools import partial
 import logging
 import os
-from typing import Any
+import random
+import threading
+import time
+from typing import Any, TypeVar
 
+import groq
+from langchain_core.caches import InMemoryCache
 from langchain_core.messages import BaseMessage
 from langchain_groq import ChatGroq
 
@@ -17,6 +25,30 @@ from app.core.config import get_settings
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Configure LangSmith tracing once at import (settings are static)
+if settings.is_tracing_enabled:
+    os.environ["LANGSMITH_TRACING"] = "true"
+    os.environ["LANGSMITH_API_KEY"] = settings.LANGSMITH_API_KEY or ""
+    os.environ["LANGSMITH_PROJECT"] = settings.LANGSMITH_PROJECT
+    os.environ["LANGSMITH_ENDPOINT"] = settings.LANGSMITH_ENDPOINT
+    logger.info("🔍 LangSmith tracing enabled for Groq")
+
+
+def _build_prompt_cache() -> InMemoryCache | None:
+    """Exact prompt cache for ChatGroq, only when ENABLE_LLM_CACHE is set"""
+    if not settings.ENABLE_LLM_CACHE:
+        return None
+    return InMemoryCache(maxsize=settings.LLM_CACHE_MAXSIZE)
+
+
+# Exact prompt cache shared by all ChatGroq instances (opt-in): repeated FAQ-style turns
+# with identical messages/params are answered without an API call
+_PROMPT_CACHE = _build_prompt_cache()
+
+# ChatGroq instances keyed by (model, temperature, max_tokens), reused across calls
+_LLM_CACHE: dict[tuple[str, float, int | None], ChatGroq] = {}
+_LLM_CACHE_LOCK = threading.Lock()
+
 
 class GroqServiceError(Exception):
     """Custom exception for Groq service errors"""
@@ -24,6 +56,87 @@ class GroqServiceError(Exception):
     pass
 
 
+# Transient errors (429, 5xx, connection/timeouts): retried with backoff, then the next
+# pool model is tried. Auth and bad-request errors are raised immediately.
+_GROQ_RETRYABLE_ERRORS = (groq.RateLimitError, groq.InternalServerError, groq.APIConnectionError)
+
+# Backoff settings (seconds) for _retry_with_backoff
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.2
+RETRY_MAX_DELAY = 2.0
+
+_T = TypeVar("_T")
+
+
+def _backoff_delay(
+    attempt: int, base: float = RETRY_BASE_DELAY, cap: float = RETRY_MAX_DELAY
+) -> float:
+    """Capped exponential backoff with full jitter for the given 0-based attempt"""
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+def _retry_with_backoff(
+    fn: Callable[[], _T],
+    attempts: int = RETRY_ATTEMPTS,
+    base: float = RETRY_BASE_DELAY,
+    cap: float = RETRY_MAX_DELAY,
+) -> _T:
+    """
+    Call fn, retrying transient Groq errors with capped exponential backoff + full jitter.
+
+    The last transient error is re-raised once attempts run out.
+    """
+    for attempt in range(attempts):
+        try:
+            return fn()
+        except _GROQ_RETRYABLE_ERRORS as e:
+            if attempt == attempts - 1:
+                raise
+            delay = _backoff_delay(attempt, base, cap)
+            logger.warning(
+                "⚠️ Groq transient error (%s), retry %d/%d in %.2fs",
+                type(e).__name__,
+                attempt + 1,
+                attempts - 1,
+                delay,
+            )
+            time.sleep(delay)
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def _invoke_with_model_fallback(
+    models: list[str],
+    messages: list[BaseMessage],
+    temperature: float,
+    max_tokens: int | None = None,
+    tools: list | None = None,
+) -> tuple[Any, str]:
+    """
+    Invoke each model in order (with backoff) until one succeeds.
+
+    Returns:
+        (response, model that answered)
+
+    Raises:
+        GroqServiceError: If every model keeps failing with transient errors
+    """
+    last_error: Exception | None = None
+    for model in models:
+        llm_instance = get_groq_llm(
+            temperature=temperature, max_tokens=max_tokens, model_name=model
+        )
+        llm: Any = llm_instance.bind_tools(tools) if tools else llm_instance
+        try:
+            return _retry_with_backoff(partial(llm.invoke, messages)), model
+        except _GROQ_RETRYABLE_ERRORS as e:
+            logger.warning("⚠️ Groq model %s unavailable, trying next...", model)
+            last_error = e
+
+    error_msg = f"All Groq models failed. Last error: {last_error}"
+    logger.error(error_msg)
+    raise GroqServiceError(error_msg) from last_error
+
+
 def get_groq_llm(
     temperature: float = 0.3, max_tokens: int | None = None, model_name: str | None = None
 ) -> ChatGroq:
@@ -41,14 +154,6 @@ def get_groq_llm(
     Raises:
         GroqServiceError: If API key is missing or all models in pool fail
     """
-    # Configure LangSmith tracing if enabled
-    if settings.is_tracing_enabled:
-        os.environ["LANGSMITH_TRACING"] = "true"
-        os.environ["LANGSMITH_API_KEY"] = settings.LANGSMITH_API_KEY or ""
-        os.environ["LANGSMITH_PROJECT"] = settings.LANGSMITH_PROJECT
-        os.environ["LANGSMITH_ENDPOINT"] = settings.LANGSMITH_ENDPOINT
-        logger.info("🔍 LangSmith tracing enabled for Groq")
-
     if not settings.GROQ_API_KEY:
         raise GroqServiceError("GROQ_API_KEY is not configured.")
 
@@ -60,18 +165,30 @@ def get_groq_llm(
     # Try each model in the pool
     last_error = None
     for model in models_to_try:
+        key = (model, temperature, max_tokens)
+        cached = _LLM_CACHE.get(key)
+        if cached is not None:
+            return cached
         try:
-            logger.info(f"Attempting to initialize Groq LLM with model: {model}")
-            llm = ChatGroq(
-                model=model,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                groq_api_key=api_key,  # type: ignore[call-arg]
-                max_retries=2,
-            )
-            logger.info(
-                f"✅ Groq LLM initialized successfully: model={model}, temperature={temperature}"
-            )
+            with _LLM_CACHE_LOCK:
+                # Re-check under the lock in case another thread built it first
+                llm = _LLM_CACHE.get(key)
+                if llm is None:
+                    logger.info("Attempting to initialize Groq LLM with model: %s", model)
+                    llm = ChatGroq(
+                        model=model,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        groq_api_key=api_key,  # type: ignore[call-arg]
+                        max_retries=0,  # Backoff handled by _retry_with_backoff and GroqProvider.astream
+                        cache=_PROMPT_CACHE,
+                    )
+                    _LLM_CACHE[key] = llm
+                    logger.info(
+                        "✅ Groq LLM initialized successfully: model=%s, temperature=%s",
+                        model,
+                        temperature,
+                    )
             return llm
         except Exception as e:
             logger.warning(f"⚠️ Failed to initialize Groq model {model}: {str(e)}")
@@ -104,16 +221,18 @@ def chat_complete_groq(
         GroqServiceError: If LLM call fails
     """
     try:
-        llm = get_groq_llm(temperature=temperature, max_tokens=max_tokens)
-
-        logger.info(f"Generating Groq completion with {len(messages)} messages")
-        logger.debug(f"Messages: {[msg.type for msg in messages]}")
+        logger.info("Generating Groq completion with %d messages", len(messages))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Messages: %s", [msg.type for msg in messages])
 
-        # Invoke the LLM
-        response = llm.invoke(messages)
+        # Invoke the LLM (backoff on transient errors, then next pool model)
+        response, _ = _invoke_with_model_fallback(
+            settings.GROQ_MODEL_POOL, messages, temperature, max_tokens=max_tokens
+        )
 
         logger.info("Groq completion generated successfully")
-        logger.debug(f"Response length: {len(str(response.content))} chars")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response length: %d chars", len(str(response.content)))
 
         # Handle response content which can be str or list
         content = response.content
@@ -145,6 +264,19 @@ class GroqProvider:
     This class provides a unified interface for Groq that llm_manager.py can use.
     """
 
+    def __init__(self):
+        # Pool model that last initialized successfully, so requests skip re-walking the
+        # pool. Cleared on rate-limit / server errors to force a fresh probe.
+        self._healthy_model: str | None = None
+
+    def _resolve_llm(self, temperature: float, model_name: str | None) -> ChatGroq:
+        """Get an LLM for an explicit model, or the pinned healthy model from the pool."""
+        if model_name:
+            return get_groq_llm(temperature=temperature, model_name=model_name)
+        llm = get_groq_llm(temperature=temperature, model_name=self._healthy_model)
+        self._healthy_model = llm.model_name
+        return llm
+
     @property
     def name(self) -> str:
         """Return provider name."""
@@ -168,27 +300,118 @@ class GroqProvider:
         """
         Invoke Groq with the given messages.
 
-        Note: Groq doesn't have the same round-robin rotation as Gemini yet.
+        Transient errors are retried with backoff before falling back to the
+        next pool model. Note: Groq doesn't have the same round-robin rotation as Gemini yet.
         """
-        llm_instance = get_groq_llm(temperature=temperature, model_name=model_name)
-        llm: Any = llm_instance.bind_tools(tools) if tools else llm_instance
-        return llm.invoke(messages)
+        if model_name:
+            models = [model_name]
+        else:
+            # Pinned healthy model first, then the rest of the pool
+            healthy = self._resolve_llm(temperature, None).model_name
+            models = [healthy] + [m for m in settings.GROQ_MODEL_POOL if m != healthy]
 
-    async def astream(
+        try:
+            response, model = _invoke_with_model_fallback(
+                models, messages, temperature, tools=tools
+            )
+        except GroqServiceError:
+            self._healthy_model = None
+            raise
+        if not model_name:
+            self._healthy_model = model
+        return response
+
+    def astream(
         self,
         messages: list[BaseMessage],
         temperature: float = 0.3,
         tools: list | None = None,
-    ):
+    ) -> AsyncIterator[BaseMessage]:
         """
         Async streaming for Groq.
 
+        Opening the stream (up to the first chunk) gets the same handling as
+        invoke: transient errors are retried with backoff, then the next pool
+        model is tried. After that the ChatGroq stream is passed through as-is.
+
         Note: Uses default Groq model pool.
+
+        Raises:
+            GroqServiceError: If every model keeps failing before its first chunk
         """
-        llm_instance = get_groq_llm(temperature=temperature)
-        llm: Any = llm_instance.bind_tools(tools) if tools else llm_instance
-        async for chunk in llm.astream(messages):
-            yield chunk
+        return _PassThroughStream(partial(self._open_stream, messages, temperature, tools))
+
+    async def _open_stream(
+        self,
+        messages: list[BaseMessage],
+        temperature: float,
+        tools: list | None,
+    ) -> tuple[BaseMessage, AsyncIterator[BaseMessage]]:
+        """Start a stream with backoff and model fallback; returns (first chunk, rest)"""
+        healthy = self._resolve_llm(temperature, None).model_name
+        models = [healthy] + [m for m in settings.GROQ_MODEL_POOL if m != healthy]
+
+        last_error: Exception | None = None
+        for model in models:
+            llm_instance = get_groq_llm(temperature=temperature, model_name=model)
+            llm: Any = llm_instance.bind_tools(tools) if tools else llm_instance
+            for attempt in range(RETRY_ATTEMPTS):
+                stream = llm.astream(messages)
+                try:
+                    first = await anext(stream)
+                except _GROQ_RETRYABLE_ERRORS as e:
+                    last_error = e
+                    if attempt == RETRY_ATTEMPTS - 1:
+                        break
+                    delay = _backoff_delay(attempt)
+                    logger.warning(
+                        "⚠️ Groq stream transient error (%s), retry %d/%d in %.2fs",
+                        type(e).__name__,
+                        attempt + 1,
+                        RETRY_ATTEMPTS - 1,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+
+                self._healthy_model = model
+                return first, stream
+            logger.warning("⚠️ Groq model %s unavailable for streaming, trying next...", model)
+
+        self._healthy_model = None
+        error_msg = f"All Groq models failed to stream. Last error: {last_error}"
+        logger.error(error_msg)
+        raise GroqServiceError(error_msg) from last_error
+
+
+class _PassThroughStream:
+    """
+    Async iterator that opens a stream lazily, then hands chunks straight through.
+
+    Only the first __anext__ runs a coroutine (the retrying open); later calls
+    return the underlying stream's own awaitable, so no generator frame sits
+    between ChatGroq and the caller.
+    """
+
+    __slots__ = ("_open", "_stream")
+
+    def __init__(
+        self, open_stream: Callable[[], Awaitable[tuple[BaseMessage, AsyncIterator[BaseMessage]]]]
+    ):
+        self._open = open_stream
+        self._stream: AsyncIterator[BaseMessage] | None = None
+
+    def __aiter__(self) -> "_PassThroughStream":
+        return self
+
+    def __anext__(self) -> Awaitable[BaseMessage]:
+        if self._stream is None:
+            return self._first_chunk()
+        return self._stream.__anext__()
+
+    async def _first_chunk(self) -> BaseMessage:
+        first, self._stream = await self._open()
+        return first
 
 
 # Singleton instance for easy import
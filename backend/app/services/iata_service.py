@@ -7,6 +7,11 @@ Hybrid strategy for looking up airport codes:
 3. Cache Amadeus results for future lookups
 """
 
+import asyncio
+from collections import OrderedDict
+from functools import cache, lru_cache
+import sys
+import threading
 from typing import Any
 
 from app.core.config import get_settings
@@ -309,6 +314,87 @@ IATA_DATABASE: dict[str, str] = {
     "accra": "ACC",
 }
 
+# Intern codes and ASCII names so every "DEL" is one object and equality is an identity check
+IATA_DATABASE = {
+    (sys.intern(city) if city.isascii() else city): sys.intern(code)
+    for city, code in IATA_DATABASE.items()
+}
+
+
+def _build_reverse_index(database: dict[str, str]) -> dict[str, str]:
+    """Map each IATA code to a display name, preferring the first ASCII (English) key."""
+    reverse: dict[str, str] = {}
+    for city, code in database.items():
+        if code not in reverse or (city.isascii() and not reverse[code].isascii()):
+            reverse[code] = city
+    return reverse
+
+
+# IATA code -> city name, for O(1) reverse lookups
+_IATA_REVERSE: dict[str, str] = _build_reverse_index(IATA_DATABASE)
+
+
+# Amadeus results, kept apart from the static IATA_DATABASE so concurrent lookups never
+# mutate it, and bounded so unusual queries can't grow memory without limit
+AMADEUS_CACHE_SIZE = 2048
+_AMADEUS_CACHE: OrderedDict[str, str] = OrderedDict()
+_AMADEUS_CACHE_LOCK = threading.Lock()
+
+
+def _amadeus_cache_get(key: str) -> str | None:
+    """Return a code previously resolved via Amadeus, marking it recently used"""
+    with _AMADEUS_CACHE_LOCK:
+        code = _AMADEUS_CACHE.get(key)
+        if code is not None:
+            _AMADEUS_CACHE.move_to_end(key)
+        return code
+
+
+@lru_cache(maxsize=1024)
+def _lookup_local(city_name: str) -> str | None:
+    """
+    Resolve a city via the local database, or accept it if already an IATA code.
+
+    Cached on the raw input so repeated cities skip normalization entirely.
+    """
+    normalized = city_name.lower().strip()
+
+    # Step 1: Search local database
+    code = IATA_DATABASE.get(normalized)
+    if code:
+        logger.debug("✅ IATA found locally: %s → %s", city_name, code)
+        return code
+
+    # Step 2: If already an IATA code (3 letters), return it
+    if len(normalized) == 3 and normalized.isascii() and normalized.isalpha():
+        return normalized.upper()
+
+    return None
+
+
+@lru_cache(maxsize=1)
+def _get_amadeus_client() -> Any:
+    """
+    Get the process-wide Amadeus client for IATA lookups (None if not configured).
+
+    Shared by every IATAService so the client and its HTTP session are built once.
+    """
+    if not (settings.AMADEUS_API_KEY and settings.AMADEUS_API_SECRET):
+        return None
+    try:
+        from amadeus import Client
+
+        client = Client(
+            client_id=settings.AMADEUS_API_KEY,
+            client_secret=settings.AMADEUS_API_SECRET,
+            hostname="test" if settings.AMADEUS_USE_TEST else "production",
+        )
+        logger.info("✅ Amadeus client ready for IATA lookups")
+        return client
+    except Exception as e:
+        logger.warning(f"⚠️ Could not init Amadeus for IATA: {e}")
+        return None
+
 
 class IATAService:
     """Hybrid service for IATA code lookups"""
@@ -318,19 +404,8 @@ class IATAService:
         self._init_amadeus()
 
     def _init_amadeus(self):
-        """Initialize Amadeus client for fallback lookups"""
-        if settings.AMADEUS_API_KEY and settings.AMADEUS_API_SECRET:
-            try:
-                from amadeus import Client
-
-                self._amadeus_client = Client(
-                    client_id=settings.AMADEUS_API_KEY,
-                    client_secret=settings.AMADEUS_API_SECRET,
-                    hostname="test" if settings.AMADEUS_USE_TEST else "production",
-                )
-                logger.info("✅ Amadeus client ready for IATA lookups")
-            except Exception as e:
-                logger.warning(f"⚠️ Could not init Amadeus for IATA: {e}")
+        """Attach the shared Amadeus client for fallback lookups"""
+        self._amadeus_client = _get_amadeus_client()
 
     def lookup(self, city_name: str) -> str | None:
         """
@@ -339,7 +414,7 @@ class IATAService:
         Strategy:
         1. Search local database (instant)
         2. If not found, try Amadeus API
-        3. Cache results for future lookups
+        3. Cache results for future lookups (bounded, separate from the local database)
 
         Args:
             city_name: City name in any language
@@ -350,25 +425,57 @@ class IATAService:
         if not city_name:
             return None
 
-        normalized = city_name.lower().strip()
-
-        # Step 1: Search local database
-        if normalized in IATA_DATABASE:
-            code = IATA_DATABASE[normalized]
-            logger.debug(f"✅ IATA found locally: {city_name} → {code}")
+        # Steps 1-2: local database / literal IATA code (memoized per raw input)
+        code = _lookup_local(city_name)
+        if code:
             return code
 
-        # Step 2: If already an IATA code (3 letters), return it
-        if len(normalized) == 3 and normalized.isalpha():
-            return normalized.upper()
+        # Step 3: Codes previously resolved via Amadeus
+        cached = _amadeus_cache_get(city_name.lower().strip())
+        if cached:
+            return cached
 
-        # Step 3: Fallback to Amadeus API
+        # Step 4: Fallback to Amadeus API
         if self._amadeus_client:
             return self._lookup_amadeus(city_name)
 
         logger.warning(f"⚠️ IATA code not found for: {city_name}")
         return None
 
+    async def lookup_many(self, cities: list[str]) -> list[str | None]:
+        """
+        Look up IATA codes for several cities (e.g. a multi-leg itinerary).
+
+        Local hits are resolved directly; the remaining cities are deduplicated and
+        sent to Amadeus concurrently instead of one after another.
+
+        Args:
+            cities: City names in any language
+
+        Returns:
+            IATA codes (or None) in the same order as ``cities``
+        """
+        resolved: dict[str, str | None] = {}
+        misses: dict[str, str] = {}  # normalized name -> first spelling seen
+        for city in dict.fromkeys(cities):
+            normalized = city.lower().strip()
+            if not normalized:
+                resolved[normalized] = None
+                continue
+            code = _lookup_local(city) or _amadeus_cache_get(normalized)
+            if code or self._amadeus_client is None:
+                resolved[normalized] = code
+            else:
+                misses.setdefault(normalized, city)
+
+        if misses:
+            codes = await asyncio.gather(
+                *(asyncio.to_thread(self._lookup_amadeus, city) for city in misses.values())
+            )
+            resolved.update(zip(misses, codes, strict=True))
+
+        return [resolved[city.lower().strip()] for city in cities]
+
     def _lookup_amadeus(self, city_name: str) -> str | None:
         """Search Amadeus API as fallback"""
         if self._amadeus_client is None:
@@ -379,10 +486,16 @@ class IATAService:
                 subType="AIRPORT,CITY",
             )
             if response.data:
-                code: str = response.data[0]["iataCode"]
-                logger.info(f"✅ IATA from Amadeus: {city_name} → {code}")
-                # Cache for future lookups
-                IATA_DATABASE[city_name.lower()] = code
+                code: str = sys.intern(response.data[0]["iataCode"])
+                logger.info("✅ IATA from Amadeus: %s → %s", city_name, code)
+                # Cache for future lookups (bounded LRU, static database untouched)
+                key = city_name.lower().strip()
+                with _AMADEUS_CACHE_LOCK:
+                    _AMADEUS_CACHE[key] = code
+                    _AMADEUS_CACHE.move_to_end(key)
+                    if len(_AMADEUS_CACHE) > AMADEUS_CACHE_SIZE:
+                        _AMADEUS_CACHE.popitem(last=False)
+                    _IATA_REVERSE.setdefault(code, key)
                 return code
         except Exception as e:
             logger.warning(f"⚠️ Amadeus IATA lookup failed: {e}")
@@ -390,20 +503,15 @@ class IATAService:
 
     def get_city_name(self, iata_code: str) -> str | None:
         """Reverse lookup: get city name from IATA code"""
-        iata_upper = iata_code.upper()
-        for city, code in IATA_DATABASE.items():
-            if code == iata_upper:
-                return city.title()
-        return None
-
-
-# Singleton instance
-_iata_service: IATAService | None = None
+        city = _IATA_REVERSE.get(iata_code.upper())
+        return city.title() if city else None
 
 
+@cache
 def get_iata_service() -> IATAService:
-    """Get global IATAService instance"""
-    global _iata_service
-    if _iata_service is None:
-        _iata_service = IATAService()
-    return _iata_service
+    """
+    Get global IATAService instance
+
+    Cached like get_flight_service(); use ``get_iata_service.cache_clear()`` to reset it.
+    """
+    return IATAService()
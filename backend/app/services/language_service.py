@@ -7,32 +7,46 @@ instructions for the LLM to ensure responses in the correct language.
 Using Lingua for high-accuracy language detection (95%+ accuracy).
 """
 
+from functools import lru_cache
 import logging
+import re
+import string
+import threading
 
-from lingua import Language, LanguageDetectorBuilder
+from lingua import Language, LanguageDetector, LanguageDetectorBuilder
 
 logger = logging.getLogger(__name__)
 
-# Build Lingua detector with supported languages
-# Using a focused set for performance (loads only needed language models)
-LINGUA_DETECTOR = (
-    LanguageDetectorBuilder.from_languages(
-        Language.ENGLISH,
-        Language.SPANISH,
-        Language.PORTUGUESE,
-        Language.FRENCH,
-        Language.GERMAN,
-        Language.ITALIAN,
-        Language.HINDI,
-        Language.JAPANESE,
-        Language.KOREAN,
-        Language.CHINESE,
-        Language.ARABIC,
-        Language.RUSSIAN,
-    )
-    .with_preloaded_language_models()
-    .build()
-)
+# Lingua detector, built on first use so processes that never detect languages
+# (health checks, scripts) skip the model loading. Language models are loaded
+# lazily by Lingua itself as texts need them.
+_LINGUA_DETECTOR: LanguageDetector | None = None
+_LINGUA_LOCK = threading.Lock()
+
+
+def _get_detector() -> LanguageDetector:
+    """Get the shared Lingua detector, building it on first call."""
+    global _LINGUA_DETECTOR
+    if _LINGUA_DETECTOR is None:
+        with _LINGUA_LOCK:
+            if _LINGUA_DETECTOR is None:
+                # Focused language set (only these models can ever be loaded)
+                _LINGUA_DETECTOR = LanguageDetectorBuilder.from_languages(
+                    Language.ENGLISH,
+                    Language.SPANISH,
+                    Language.PORTUGUESE,
+                    Language.FRENCH,
+                    Language.GERMAN,
+                    Language.ITALIAN,
+                    Language.HINDI,
+                    Language.JAPANESE,
+                    Language.KOREAN,
+                    Language.CHINESE,
+                    Language.ARABIC,
+                    Language.RUSSIAN,
+                ).build()
+    return _LINGUA_DETECTOR
+
 
 # Map Lingua Language enum to ISO 639-1 codes
 LINGUA_TO_ISO = {
@@ -72,7 +86,7 @@ LANGUAGE_NAMES = {
 
 # Keyword patterns for short text detection (avoids langdetect unreliability)
 # These are common words/phrases that clearly indicate a language
-LANGUAGE_KEYWORDS = {
+_RAW_KEYWORDS = {
     "es": [
         "hola",
         "gracias",
@@ -153,6 +167,9 @@ LANGUAGE_KEYWORDS = {
     ],
     "pt": [
         "olá",
+        "bom dia",
+        "boa tarde",
+        "boa noite",
         "obrigado",
         "obrigada",
         "ajuda",
@@ -184,56 +201,162 @@ LANGUAGE_KEYWORDS = {
         "besoin",
         "chercher",
     ],
+    "it": [
+        "ciao",
+        "grazie",
+        "prego",
+        "buongiorno",
+        "buonasera",
+        "arrivederci",
+        "aiuto",
+        "volo",
+        "voli",
+        "bagaglio",
+        "domani",
+    ],
+    "de": [
+        "hallo",
+        "danke",
+        "bitte",
+        "guten tag",
+        "guten morgen",
+        "hilfe",
+        "flug",
+        "flüge",
+        "gepäck",
+    ],
+}
+
+# Casefolded keyword sets per language (O(1) exact-match lookups); dict order is priority
+LANGUAGE_KEYWORDS: dict[str, frozenset[str]] = {
+    lang: frozenset(kw.casefold() for kw in keywords) for lang, keywords in _RAW_KEYWORDS.items()
 }
 
+# One pass over non-ASCII text for keyword substrings. The lookahead reports a match at every
+# position, and alternatives are ordered by language priority, so the best language at each
+# position is the one the per-language substring scan would have picked.
+_KEYWORD_LANG: dict[str, str] = {}
+for _lang, _keywords in LANGUAGE_KEYWORDS.items():
+    for _kw in sorted(_keywords):
+        _KEYWORD_LANG.setdefault(_kw, _lang)
+_KEYWORD_SUBSTRING_RE = re.compile("(?=(" + "|".join(re.escape(kw) for kw in _KEYWORD_LANG) + "))")
+del _lang, _keywords, _kw
+
+
 # Words that distinguish Spanish from Portuguese
-SPANISH_DISTINCTIVE = [
-    "vuelo",
-    "vuelos",
-    "equipaje",
-    "buscar",
-    "cuánto",
-    "cuándo",
-    "dónde",
-    "mañana",
-    "avión",
-]
-PORTUGUESE_DISTINCTIVE = [
-    "voo",
-    "voos",
-    "bagagem",
-    "procurar",
-    "quanto",
-    "quando",
-    "onde",
-    "amanhã",
-    "avião",
-]
+SPANISH_DISTINCTIVE = frozenset(
+    {
+        "vuelo",
+        "vuelos",
+        "equipaje",
+        "buscar",
+        "cuánto",
+        "cuándo",
+        "dónde",
+        "mañana",
+        "avión",
+    }
+)
+PORTUGUESE_DISTINCTIVE = frozenset(
+    {
+        "voo",
+        "voos",
+        "bagagem",
+        "procurar",
+        "quanto",
+        "quando",
+        "onde",
+        "amanhã",
+        "avião",
+    }
+)
 
 # Words that distinguish Italian from Spanish (to prevent misdetection)
-ITALIAN_DISTINCTIVE = [
-    "volo",
-    "voli",
-    "bagaglio",
-    "cercare",
-    "quanto",
-    "quando",
-    "dove",
-    "domani",
-    "aereo",
-    "grazie",
-    "prego",
-    "scusa",
-    "buongiorno",
-    "arrivederci",
-]
-
-
-def detect_language(text: str, default: str = "en", session_hint: str | None = None) -> str:
+ITALIAN_DISTINCTIVE = frozenset(
+    {
+        "volo",
+        "voli",
+        "bagaglio",
+        "cercare",
+        "quanto",
+        "quando",
+        "dove",
+        "domani",
+        "aereo",
+        "grazie",
+        "prego",
+        "scusa",
+        "buongiorno",
+        "arrivederci",
+    }
+)
+
+
+# Stripped from token edges so "hola!" and "¿cuándo?" still hit the keyword sets
+_TOKEN_PUNCTUATION = string.punctuation + "¿¡"
+
+
+def _keyword_tokens(text_clean: str) -> set[str]:
+    """Words of a short text plus adjacent word pairs (for phrases like "thank you")."""
+    # str.split beats a \w+ regex here and keeps Devanagari vowel signs inside the word
+    words = [word.strip(_TOKEN_PUNCTUATION) for word in text_clean.split()]
+    tokens = set(words)
+    tokens.update(f"{first} {second}" for first, second in zip(words, words[1:], strict=False))
+    return tokens
+
+
+# Unicode blocks that identify a single supported language: (start, end, lang)
+_SCRIPT_RANGES = (
+    (0x0900, 0x097F, "hi"),  # Devanagari
+    (0x0600, 0x06FF, "ar"),  # Arabic
+    (0x0400, 0x04FF, "ru"),  # Cyrillic
+    (0x3040, 0x30FF, "ja"),  # Hiragana / Katakana
+    (0xAC00, 0xD7AF, "ko"),  # Hangul syllables
+    (0x4E00, 0x9FFF, "zh-cn"),  # CJK Unified Ideographs (also used in Japanese)
+)
+_SCRIPT_SAMPLE_SIZE = 32
+
+
+def _script_hint(text_clean: str) -> str | None:
+    """
+    Identify the language from its script when that is unambiguous.
+
+    Samples the first characters; the script must outnumber Latin letters, and kanji
+    count as Japanese whenever kana are present. Returns None for Latin-script text.
+    """
+    if text_clean.isascii():
+        return None
+
+    counts: dict[str, int] = {}
+    latin = 0
+    for char in text_clean[:_SCRIPT_SAMPLE_SIZE]:
+        code_point = ord(char)
+        if code_point < 0x0250:
+            latin += char.isalpha()
+            continue
+        for start, end, lang in _SCRIPT_RANGES:
+            if start <= code_point <= end:
+                counts[lang] = counts.get(lang, 0) + 1
+                break
+
+    if "ja" in counts:
+        counts["ja"] += counts.pop("zh-cn", 0)
+    if not counts:
+        return None
+    lang, count = max(counts.items(), key=lambda item: item[1])
+    return lang if count > latin else None
+
+
+def detect_language(
+    text: str,
+    default: str = "en",
+    session_hint: str | None = None,
+) -> str:
     """
     Detect language of text using keywords + Lingua.
 
     Strategy:
+    0. Script check for unambiguous non-Latin text (Devanagari, Hangul, kana...)
     1. Keywords for short texts (< 15 chars) - instant and reliable
     2. Lingua for longer texts - 95%+ accuracy
     3. Session hint as fallback
@@ -246,29 +369,62 @@ def detect_language(text: str, default: str = "en", session_hint: str | None = N
     Returns:
         ISO 639-1 language code (e.g., 'en', 'es', 'hi')
     """
-    if not text or not text.strip():
+    text_stripped = text.strip() if text else ""
+    if not text_stripped:
         logger.warning("Empty text provided for language detection")
         return session_hint or default
 
-    text_clean = text.lower().strip()
+    # Only the short-text keyword stage needs casefolding; the script check and Lingua
+    # are case-insensitive, so long messages skip the extra full-length copy.
+    if len(text_stripped) < 15:
+        text_stripped = text_stripped.casefold()
+    return _detect_normalized(text_stripped, default, session_hint)
+
+
+@lru_cache(maxsize=2048)
+def _detect_normalized(
+    text_clean: str,
+    default: str,
+    session_hint: str | None,
+) -> str:
+    """
+    Detection stages for stripped text (casefolded when short).
+
+    Cached because chat flows repeat the same short messages ("hola", "thanks").
+    """
+    # Stage 0: Unambiguous non-Latin scripts map straight to a language
+    script_lang = _script_hint(text_clean)
+    if script_lang:
+        logger.info("🌍 Script detected as %s: '%.40s'", script_lang, text_clean)
+        return script_lang
 
     # Stage 1: For short texts, use keyword matching (faster and reliable)
     if len(text_clean) < 15:
+        # Split once and intersect with each language's keyword set
+        tokens = _keyword_tokens(text_clean)
         for lang, keywords in LANGUAGE_KEYWORDS.items():
-            if text_clean in keywords or any(kw in text_clean for kw in keywords):
+            if not tokens.isdisjoint(keywords):
                 logger.info(f"🌍 Short text detected as {lang}: '{text_clean}'")
                 return lang
 
+        # Scripts without reliable whitespace word breaks (CJK, Devanagari) need substrings
+        if not text_clean.isascii():
+            hits = {_KEYWORD_LANG[m.group(1)] for m in _KEYWORD_SUBSTRING_RE.finditer(text_clean)}
+            for lang in LANGUAGE_KEYWORDS:
+                if lang in hits:
+                    logger.info(f"🌍 Short text detected as {lang}: '{text_clean}'")
+                    return lang
+
         # If no keyword match and we have a session hint, use it
         if session_hint:
             logger.info(f"🌍 Using session hint for short text: {session_hint}")
             return session_hint
 
     # Stage 2: Use Lingua (95%+ accuracy)
-    lingua_result = LINGUA_DETECTOR.detect_language_of(text)
+    lingua_result = _get_detector().detect_language_of(text_clean)
     if lingua_result:
         detected = LINGUA_TO_ISO.get(lingua_result, default)
-        logger.info(f"🌍 Lingua: {lingua_result.name} ({detected}) for: '{text[:40]}...'")
+        logger.info("🌍 Lingua: %s (%s) for: '%.40s...'", lingua_result.name, detected, text_clean)
         return detected
 
     # Fallback
@@ -288,6 +444,15 @@ def get_language_instruction(lang_code: str) -> str:
     This instruction is injected into the system prompt to ensure
     the LLM responds in the user's detected language.
     """
+    instruction = _LANGUAGE_INSTRUCTIONS.get(lang_code)
+    if instruction is None:
+        instruction = _build_language_instruction(lang_code)
+    return instruction
+
+
+@lru_cache(maxsize=32)
+def _build_language_instruction(lang_code: str) -> str:
+    """Render the language instruction (precomputed for known codes, cached otherwise)."""
     lang_name = get_language_name(lang_code)
 
     # Special handling for Spanish/Portuguese confusion
@@ -308,3 +473,9 @@ def get_language_instruction(lang_code: str) -> str:
 - Do NOT switch to English unless the user explicitly asks.
 - Maintain natural, professional {lang_name} throughout your entire response.{disambiguation}
 """
+
+
+# The set of supported languages is fixed, so every instruction is rendered once at import
+_LANGUAGE_INSTRUCTIONS: dict[str, str] = {
+    code: _build_language_instruction(code) for code in LANGUAGE_NAMES
+}
@@ -23,16 +23,12 @@ To add a new provider:
 """
 
 import logging
-from typing import TYPE_CHECKING
 
 from langchain_core.messages import AIMessage, BaseMessage
 
 from app.core.config import get_settings
 from app.services.llm_base import LLMServiceError
 
-if TYPE_CHECKING:
-    pass
-
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
@@ -56,7 +52,17 @@ class LLMManager:
         self._initialized = False
 
     def _ensure_initialized(self):
-        """Lazy initialization of providers."""
+        """Initialize on first use when startup didn't (scripts, tests)."""
+        if not self._initialized:
+            self.initialize()
+
+    def initialize(self) -> None:
+        """
+        Import providers and resolve the active one.
+
+        Called from the FastAPI startup hook so the provider imports happen before the
+        first request instead of inside it. Safe to call more than once.
+        """
         if self._initialized:
             return
 
@@ -80,7 +86,7 @@ class LLMManager:
 
         self._active_provider = self._providers[provider_name]
         self._initialized = True
-        logger.info(f"🤖 LLM Manager initialized with provider: {provider_name}")
+        logger.info("🤖 LLM Manager initialized with provider: %s", provider_name)
 
     @property
     def provider(self):
@@ -108,7 +114,7 @@ class LLMManager:
         """
         self._ensure_initialized()
         assert self._active_provider is not None
-        logger.debug(f"Getting LLM from {self.provider_name}")
+        logger.debug("Getting LLM from %s", self._active_provider.name)
         return self._active_provider.get_llm(
             temperature=temperature,
             model_name=model_name,
@@ -137,7 +143,7 @@ class LLMManager:
         """
         self._ensure_initialized()
         assert self._active_provider is not None
-        logger.info(f"🔄 Invoking LLM via {self.provider_name}")
+        logger.info("🔄 Invoking LLM via %s", self._active_provider.name)
         return self._active_provider.invoke(  # type: ignore[no-any-return]
             messages=messages,
             temperature=temperature,
@@ -166,7 +172,7 @@ class LLMManager:
         """
         self._ensure_initialized()
         assert self._active_provider is not None
-        logger.info(f"🔄 Streaming via {self.provider_name}")
+        logger.info("🔄 Streaming via %s", self._active_provider.name)
         async for chunk in self._active_provider.astream(
             messages=messages,
             temperature=temperature,
@@ -5,36 +5,88 @@ This service manages conversation history for each user session.
 It stores messages in-memory and provides TTL-based cleanup.
 """
 
-from datetime import datetime, timedelta
+from collections import OrderedDict
+import heapq
 import logging
+import time
 from typing import Any, cast
 
-from langchain.memory import ConversationBufferMemory
-from langchain_core.messages import BaseMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 
 logger = logging.getLogger(__name__)
 
+# Role flags stored per message in SessionHistory
+_ROLE_USER = 0
+_ROLE_ASSISTANT = 1
+
+
+class SessionHistory:
+    """
+    Compact append-only chat history for one session.
+
+    Stores a role flag per message in a bytearray plus the raw content strings,
+    instead of one LangChain message object (with its metadata dicts) per turn.
+    Message objects are only built when the history is read.
+    """
+
+    __slots__ = ("_roles", "_contents")
+
+    def __init__(self) -> None:
+        self._roles = bytearray()
+        self._contents: list[str] = []
+
+    def add_user_message(self, content: str) -> None:
+        """Append a user turn."""
+        self._roles.append(_ROLE_USER)
+        self._contents.append(content)
+
+    def add_ai_message(self, content: str) -> None:
+        """Append an assistant turn."""
+        self._roles.append(_ROLE_ASSISTANT)
+        self._contents.append(content)
+
+    @property
+    def messages(self) -> list[BaseMessage]:
+        """Materialize the history as LangChain messages, oldest first."""
+        return [
+            HumanMessage(content=content) if role == _ROLE_USER else AIMessage(content=content)
+            for role, content in zip(self._roles, self._contents, strict=True)
+        ]
+
+    def __len__(self) -> int:
+        """Number of stored messages."""
+        return len(self._contents)
+
 
 class MemoryService:
     """
     Manages conversation memory for multiple sessions.
 
     Each session has its own conversation history stored in-memory.
-    Old sessions are automatically cleaned up based on TTL.
+    Old sessions are automatically cleaned up based on TTL, and the number of
+    live sessions is capped with LRU eviction.
     """
 
-    def __init__(self, ttl_minutes: int | float = 60):
+    def __init__(self, ttl_minutes: int | float = 60, max_sessions: int = 10_000):
         """
         Initialize the memory service.
 
         Args:
             ttl_minutes: Time-to-live for sessions in minutes (default: 60)
-        """
-        self._sessions: dict[str, dict[str, Any]] = {}
+            max_sessions: Hard cap on live sessions; the least recently used
+                session is evicted beyond it (default: 10,000)
+        """
+        # Kept in access order (oldest first) for LRU eviction
+        self._sessions: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._max_sessions = max_sessions
+        # (last_accessed, session_id), pushed on every touch; older entries for a
+        # session go stale and are skipped when popped
+        self._expiry_heap: list[tuple[float, str]] = []
         self._ttl_minutes = ttl_minutes
+        self._ttl_seconds = ttl_minutes * 60
         logger.info(f"Memory service initialized with TTL={ttl_minutes} minutes")
 
-    def get_or_create_memory(self, session_id: str) -> ConversationBufferMemory:
+    def get_or_create_memory(self, session_id: str) -> SessionHistory:
         """
         Get existing memory for a session or create a new one.
 
@@ -42,24 +94,31 @@ class MemoryService:
             session_id: Unique session identifier
 
         Returns:
-            ConversationBufferMemory instance for the session
+            Append-only message history for the session
         """
         # Clean up old sessions first
-        self._cleanup_old_sessions()
+        now = time.monotonic()
+        self._cleanup_old_sessions(now)
 
         # Get or create session
-        if session_id not in self._sessions:
+        session = self._sessions.get(session_id)
+        if session is None:
+            if len(self._sessions) >= self._max_sessions:
+                evicted_id, _ = self._sessions.popitem(last=False)
+                logger.info(f"Evicted least recently used session: {evicted_id}")
             logger.info(f"Creating new memory for session: {session_id}")
-            self._sessions[session_id] = {
-                "memory": ConversationBufferMemory(return_messages=True),
-                "created_at": datetime.now(),
-                "last_accessed": datetime.now(),
+            session = self._sessions[session_id] = {
+                "memory": SessionHistory(),
+                "created_at": now,
+                "last_accessed": now,
             }
         else:
             # Update last accessed time
-            self._sessions[session_id]["last_accessed"] = datetime.now()
+            session["last_accessed"] = now
+            self._sessions.move_to_end(session_id)
+        heapq.heappush(self._expiry_heap, (now, session_id))
 
-        return cast(ConversationBufferMemory, self._sessions[session_id]["memory"])
+        return cast(SessionHistory, session["memory"])
 
     def add_message(self, session_id: str, role: str, content: str) -> None:
         """
@@ -76,10 +135,10 @@ class MemoryService:
         memory = self.get_or_create_memory(session_id)
 
         if role == "user":
-            memory.chat_memory.add_user_message(content)
+            memory.add_user_message(content)
             logger.debug(f"Added user message to session {session_id}")
         elif role == "assistant":
-            memory.chat_memory.add_ai_message(content)
+            memory.add_ai_message(content)
             logger.debug(f"Added assistant message to session {session_id}")
         else:
             raise ValueError(f"Invalid role: {role}. Must be 'user' or 'assistant'")
@@ -99,7 +158,7 @@ class MemoryService:
             return []
 
         memory = self._sessions[session_id]["memory"]
-        messages = memory.chat_memory.messages
+        messages = memory.messages
 
         logger.debug(f"Retrieved {len(messages)} messages for session {session_id}")
         return cast(list[BaseMessage], messages)
@@ -135,31 +194,32 @@ class MemoryService:
         """
         return list(self._sessions.keys())
 
-    def _cleanup_old_sessions(self) -> None:
+    def _cleanup_old_sessions(self, now: float | None = None) -> None:
         """
         Remove sessions that haven't been accessed within TTL.
 
-        This is called automatically on each get_or_create_memory call.
-        """
-        now = datetime.now()
-        ttl_delta = timedelta(minutes=self._ttl_minutes)
-
-        sessions_to_remove = []
-
-        for session_id, session_data in self._sessions.items():
-            last_accessed = session_data["last_accessed"]
-            age = now - last_accessed
-
-            if age > ttl_delta:
-                sessions_to_remove.append(session_id)
-
-        # Remove old sessions
-        for session_id in sessions_to_remove:
+        This is called automatically on each get_or_create_memory call. Only heap
+        entries older than the TTL are visited, so the cost scales with the number
+        of expirations rather than the number of sessions.
+        """
+        if now is None:
+            now = time.monotonic()
+        cutoff = now - self._ttl_seconds
+        heap = self._expiry_heap
+        removed = 0
+
+        while heap and heap[0][0] < cutoff:
+            last_accessed, session_id = heapq.heappop(heap)
+            session = self._sessions.get(session_id)
+            # Skip entries superseded by a later access (or a cleared session)
+            if session is None or session["last_accessed"] != last_accessed:
+                continue
             del self._sessions[session_id]
+            removed += 1
             logger.info(f"Cleaned up expired session: {session_id}")
 
-        if sessions_to_remove:
-            logger.info(f"Cleaned up {len(sessions_to_remove)} expired sessions")
+        if removed:
+            logger.info(f"Cleaned up {removed} expired sessions")
 
 
 # Global memory service instance
@@ -8,22 +8,78 @@ This module handles the RAG (Retrieval-Augmented Generation) pipeline:
 4. Storing and retrieving vectors using pgvector.
 """
 
-from langchain_community.document_loaders import DirectoryLoader, TextLoader
+import asyncio
+from collections import OrderedDict
+from collections.abc import Iterator
+from itertools import islice
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
 from langchain_core.documents import Document
-from langchain_postgres import PGVector
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from app.core.config import get_settings
 from app.db.database import db_url
 from app.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from langchain_community.document_loaders import DirectoryLoader
+
+try:
+    from google.api_core import exceptions as gexc
+
+    _QUOTA_ERRORS: tuple[type[Exception], ...] = (gexc.ResourceExhausted, gexc.TooManyRequests)
+except ImportError:  # pragma: no cover - google-api-core ships with langchain-google-genai
+    _QUOTA_ERRORS = ()
+
 settings = get_settings()
 logger = get_logger(__name__)
 
+# Chunks per add_documents call: one batchEmbedContents request (API max 100) + one insert
+INGEST_BATCH_SIZE = 100
+INGEST_MAX_RETRIES = 5
+INGEST_MAX_BACKOFF = 60
+# Batches in flight for aingest_data; beyond a few, the embedding quota is the limit
+INGEST_CONCURRENCY = 4
+
+# Markdown-aware splitter, stateless between calls so one instance serves every ingest
+_TEXT_SPLITTER = RecursiveCharacterTextSplitter(
+    chunk_size=1000, chunk_overlap=200, separators=["\n## ", "\n### ", "\n", " ", ""]
+)
+
+# Query embeddings kept in memory; chat traffic repeats the same questions a lot
+QUERY_EMBEDDING_CACHE_SIZE = 512
+
+
+class IngestResult(NamedTuple):
+    """Outcome of an ingest run: chunks stored out of those produced, and failed batches."""
+
+    stored: int
+    expected: int
+    failed_batches: list[int]
+
+    @property
+    def complete(self) -> bool:
+        return self.stored == self.expected
+
+
+def _is_rate_limited(error: BaseException | None) -> bool:
+    """Whether an error (or the API error it wraps) is a 429 / quota error."""
+    while error is not None:
+        if isinstance(error, _QUOTA_ERRORS):
+            return True
+        error = error.__cause__
+    return False
+
 
 class VectorService:
     def __init__(self):
+        # Heavy client libraries (SQLAlchemy/psycopg via langchain-postgres) load only
+        # when the service is actually built, not whenever this module is imported
         from langchain_google_genai import GoogleGenerativeAIEmbeddings
+        from langchain_postgres import PGVector
 
         logger.info("Initializing VectorService...")
 
@@ -49,8 +105,6 @@ class VectorService:
             try:
                 logger.info(f"🔗 Trying {key_name} for embeddings ({settings.EMBEDDING_MODEL})...")
                 # Set API key via environment variable to avoid SecretStr/gRPC issues
-                import os
-
                 os.environ["GOOGLE_API_KEY"] = str(api_key)
                 self.embeddings = GoogleGenerativeAIEmbeddings(
                     model=settings.EMBEDDING_MODEL,
@@ -77,6 +131,10 @@ class VectorService:
         # PGVector from langchain-postgres requests a specific connection format or engine.
         # But for simplicity in this version, passing the connection string usually works
         # if the driver (psycopg 3) is installed.
+        # Bounded LRU of query -> embedding, shared across request threads
+        self._query_embeddings: OrderedDict[str, list[float]] = OrderedDict()
+        self._query_embeddings_lock = threading.Lock()
+
         self.vector_store = PGVector(
             embeddings=self.embeddings,
             collection_name=settings.VECTOR_STORE_COLLECTION_NAME,
@@ -87,60 +145,169 @@ class VectorService:
     def load_documents(self, directory_path: str) -> list[Document]:
         """Loads markdown files from a directory."""
         logger.info(f"Loading documents from {directory_path}")
-        loader = DirectoryLoader(directory_path, glob="**/*.md", loader_cls=TextLoader)
-        return loader.load()
+        return self._directory_loader(directory_path).load()
 
     def split_documents(self, documents: list[Document]) -> list[Document]:
         """Splits documents into smaller chunks for flexible retrieval."""
         logger.info(f"Splitting {len(documents)} documents...")
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000, chunk_overlap=200, separators=["\n## ", "\n### ", "\n", " ", ""]
-        )
-        chunks = text_splitter.split_documents(documents)
+        chunks = _TEXT_SPLITTER.split_documents(documents)
         logger.info(f"Generated {len(chunks)} chunks.")
         return chunks
 
-    def ingest_data(self, directory_path: str):
-        """Orchestrates loading, splitting, and storing documents."""
-        docs = self.load_documents(directory_path)
-        chunks = self.split_documents(docs)
+    def ingest_data(self, directory_path: str) -> IngestResult:
+        """
+        Orchestrates loading, splitting, and storing documents.
 
-        if not chunks:
-            logger.warning("No chunks to ingest.")
-            return
+        Returns:
+            Chunks stored vs. produced (failed batches are logged and skipped)
+        """
+        stored = expected = 0
+        failed_batches: list[int] = []
+        for batch_number, batch in enumerate(self._iter_batches(directory_path), start=1):
+            logger.info("Ingesting batch %d (%d chunks)...", batch_number, len(batch))
+            expected += len(batch)
+            if self._add_batch_with_backoff(batch, batch_number):
+                stored += len(batch)
+            else:
+                failed_batches.append(batch_number)
+
+        return self._ingest_result(stored, expected, failed_batches)
 
-        import time
+    async def aingest_data(
+        self, directory_path: str, concurrency: int = INGEST_CONCURRENCY
+    ) -> IngestResult:
+        """
+        Like ingest_data, but keeps several batches in flight at once.
 
-        logger.info(f"Adding {len(chunks)} chunks to vector store...")
+        The store runs in sync mode, so each batch is uploaded in a worker thread; this
+        overlaps one batch's embedding call with another's database insert. The next
+        batch is only cut once a slot frees up, so at most ``concurrency`` batches are
+        held in memory.
 
-        # Batching to avoid Rate Limit (429) - Extreme Conservative
-        batch_size = 1
-        for i in range(0, len(chunks), batch_size):
-            batch = chunks[i : i + batch_size]
-            logger.info(
-                f"Ingesting batch {i // batch_size + 1}/{len(chunks) // batch_size + 1} ({len(batch)} chunks)..."
+        Returns:
+            Chunks stored vs. produced (failed batches are logged and skipped)
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        uploads: list[asyncio.Task[bool]] = []
+        sizes: list[int] = []
+
+        async def upload(batch: list[Document], batch_number: int) -> bool:
+            try:
+                return await asyncio.to_thread(self._add_batch_with_backoff, batch, batch_number)
+            finally:
+                semaphore.release()
+
+        for batch_number, batch in enumerate(self._iter_batches(directory_path), start=1):
+            await semaphore.acquire()
+            logger.info("Ingesting batch %d (%d chunks)...", batch_number, len(batch))
+            uploads.append(asyncio.create_task(upload(batch, batch_number)))
+            sizes.append(len(batch))
+
+        results = await asyncio.gather(*uploads)
+        stored = sum(size for size, ok in zip(sizes, results, strict=True) if ok)
+        failed_batches = [number for number, ok in enumerate(results, start=1) if not ok]
+        return self._ingest_result(stored, sum(sizes), failed_batches)
+
+    def _directory_loader(self, directory_path: str, threaded: bool = True) -> "DirectoryLoader":
+        """
+        Markdown loader for the knowledge base directory.
+
+        The threaded loader reads files in parallel (they are I/O bound), but its
+        lazy_load submits every file up front and yields them in completion order.
+        Pass ``threaded=False`` when files must stream one at a time in glob order.
+        """
+        from langchain_community.document_loaders import DirectoryLoader, TextLoader
+
+        if not threaded:
+            return DirectoryLoader(directory_path, glob="**/*.md", loader_cls=TextLoader)
+        return DirectoryLoader(
+            directory_path,
+            glob="**/*.md",
+            loader_cls=TextLoader,
+            use_multithreading=True,
+            max_concurrency=max(4, os.cpu_count() or 1),
+        )
+
+    def _iter_batches(self, directory_path: str) -> Iterator[list[Document]]:
+        """
+        Stream the knowledge base as add_documents-sized batches of chunks.
+
+        Files are read one at a time, in glob order, and each is split as soon as it is
+        loaded, so neither the full document list nor the full chunk list is ever
+        materialized and batch numbers stay the same between runs on the same tree.
+        """
+        logger.info("Streaming documents from %s", directory_path)
+        chunks = (
+            chunk
+            for document in self._directory_loader(directory_path, threaded=False).lazy_load()
+            for chunk in _TEXT_SPLITTER.split_documents([document])
+        )
+        while batch := list(islice(chunks, INGEST_BATCH_SIZE)):
+            yield batch
+
+    @staticmethod
+    def _ingest_result(stored: int, expected: int, failed_batches: list[int]) -> IngestResult:
+        """Log how many chunks an ingest run stored and which batches failed, and report it."""
+        if failed_batches:
+            logger.error(
+                "Ingestion incomplete: %d chunks stored, %d batch(es) failed: %s",
+                stored,
+                len(failed_batches),
+                failed_batches,
             )
+        elif stored:
+            logger.info("Ingestion complete (%d chunks).", stored)
+        else:
+            logger.warning("No chunks to ingest.")
+        return IngestResult(stored, expected, failed_batches)
+
+    def _add_batch_with_backoff(self, batch: list[Document], batch_number: int) -> bool:
+        """
+        Store one batch, backing off exponentially only when the API rate-limits us.
+
+        Returns:
+            True if the batch was stored, False if it failed or retries ran out
+        """
+        for attempt in range(INGEST_MAX_RETRIES + 1):
             try:
                 self.vector_store.add_documents(batch)
+                return True
             except Exception as e:
-                logger.error(f"Error adding batch: {e}")
-                # Wait longer if error
-                time.sleep(10)
-                continue
-            time.sleep(5)  # Sleep to respect rate limits
+                if attempt == INGEST_MAX_RETRIES or not _is_rate_limited(e):
+                    logger.error("Error adding batch %d: %s", batch_number, e)
+                    return False
+                delay = min(INGEST_MAX_BACKOFF, 2**attempt)
+                logger.warning(
+                    "⏳ Rate limited on batch %d, retrying in %ds...", batch_number, delay
+                )
+                time.sleep(delay)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _embed_query(self, query: str) -> list[float]:
+        """Embed a search query, reusing the vector for queries seen recently."""
+        with self._query_embeddings_lock:
+            embedding = self._query_embeddings.get(query)
+            if embedding is not None:
+                self._query_embeddings.move_to_end(query)
+                return embedding
 
-        logger.info("Ingestion complete.")
+        embedding = self.embeddings.embed_query(query)
+        with self._query_embeddings_lock:
+            self._query_embeddings[query] = embedding
+            if len(self._query_embeddings) > QUERY_EMBEDDING_CACHE_SIZE:
+                self._query_embeddings.popitem(last=False)
+        return embedding
 
     def similarity_search(self, query: str, k: int = 4) -> list[Document]:
         """Searches the vector store for relevant chunks."""
-        return self.vector_store.similarity_search(query, k=k)
+        return self.vector_store.similarity_search_by_vector(self._embed_query(query), k=k)
 
     def as_retriever(self):
         """Returns the vector store as a retriever interface."""
         return self.vector_store.as_retriever()
 
 
-# Singleton instance - ensures embedding model is loaded only once
+# Singleton instance - embeddings client and PGVector engine are built only once
 _vector_service: VectorService | None = None
 
 
@@ -148,8 +315,8 @@ def get_vector_service() -> VectorService:
     """
     Get the global VectorService instance (singleton).
 
-    This is critical for production: the embedding model takes ~70 seconds
-    to load, so we only want to load it once, not on every request.
+    Embeddings are served by Google's API, so there is no model to load; the
+    singleton keeps one embeddings client and one PGVector connection pool.
     """
     global _vector_service
     if _vector_service is None:
@@ -5,14 +5,60 @@ This module defines LangChain tools for flight search and details.
 Uses Pydantic schemas to guide LLM on expected input formats.
 """
 
+import asyncio
+import atexit
+from collections import OrderedDict
+from collections.abc import Coroutine
+from functools import lru_cache
+import threading
+import time
+from typing import Any, TypeVar
+
 from langchain.tools import StructuredTool
 from pydantic import BaseModel, Field
 
 from app.services.flight_service import get_flight_service
+from app.services.iata_service import get_iata_service
 from app.utils.logger import get_logger
+from data.flight_data import normalize_location
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# Date values that mean "no specific date" and are searched without a date filter
+_DATE_WILDCARDS = frozenset({"any", "tomorrow"})
+
+# Formatted search results, keyed by (origin, destination, date filter).
+# Schedules and fares change slowly, so a short TTL saves Amadeus calls and re-formatting.
+SEARCH_CACHE_TTL = 600.0
+SEARCH_CACHE_SIZE = 512
+_SEARCH_CACHE: OrderedDict[tuple[str, str, str | None], tuple[float, str]] = OrderedDict()
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+
+def _search_cache_get(key: tuple[str, str, str | None]) -> str | None:
+    """Return a cached search result if it hasn't expired"""
+    with _SEARCH_CACHE_LOCK:
+        entry = _SEARCH_CACHE.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at < time.monotonic():
+            del _SEARCH_CACHE[key]
+            return None
+        _SEARCH_CACHE.move_to_end(key)
+        return result
+
+
+def _search_cache_put(key: tuple[str, str, str | None], result: str) -> None:
+    """Store a search result, evicting the least recently used entry when full"""
+    with _SEARCH_CACHE_LOCK:
+        _SEARCH_CACHE[key] = (time.monotonic() + SEARCH_CACHE_TTL, result)
+        _SEARCH_CACHE.move_to_end(key)
+        if len(_SEARCH_CACHE) > SEARCH_CACHE_SIZE:
+            _SEARCH_CACHE.popitem(last=False)
+
 
 # ============================================
 # Pydantic Schemas for Tool Inputs
@@ -56,6 +102,34 @@ class FlightSearchInput(BaseModel):
     )
 
 
+class FlightSearchByCityInput(BaseModel):
+    """Input schema for flight search by city names (codes are resolved by the tool)"""
+
+    origin_city: str = Field(
+        description="Origin city name in any language, e.g. 'Delhi', 'Londres', '東京'"
+    )
+    destination_city: str = Field(
+        description="Destination city name in any language, e.g. 'Mumbai', 'Nueva York'"
+    )
+    date: str = Field(
+        default="tomorrow",
+        description="Travel date: 'today', 'tomorrow', or YYYY-MM-DD (same rules as search_flights)",
+    )
+
+
+class FlightSearchBatchInput(BaseModel):
+    """Input schema for searching several independent routes in one call"""
+
+    routes: list[FlightSearchInput] = Field(
+        description=(
+            "Two or more independent route searches, each with origin, destination "
+            "and date (same rules as search_flights). Use for multi-city trips, "
+            "outbound + return, or comparing several routes."
+        ),
+        min_length=2,
+    )
+
+
 class FlightDetailsInput(BaseModel):
     """Input schema for flight details lookup"""
 
@@ -75,7 +149,14 @@ class FlightDetailsInput(BaseModel):
 
 async def _search_flights_impl(origin: str, destination: str, date: str = "tomorrow") -> str:
     """Search for flights between two cities"""
-    logger.info(f"🔧 Tool called: search_flights({origin}, {destination}, {date})")
+    logger.info("🔧 Tool called: search_flights(%s, %s, %s)", origin, destination, date)
+
+    date_filter = None if date in _DATE_WILDCARDS else date
+    cache_key = (normalize_location(origin), normalize_location(destination), date_filter)
+    cached = _search_cache_get(cache_key)
+    if cached is not None:
+        logger.info("⚡ Cache hit for %s → %s", origin, destination)
+        return cached
 
     flight_service = get_flight_service()
 
@@ -83,7 +164,7 @@ async def _search_flights_impl(origin: str, destination: str, date: str = "tomor
         flights = await flight_service.search_flights(
             origin=origin,
             destination=destination,
-            date=date if date not in ("any", "tomorrow") else None,
+            date=date_filter,
         )
 
         if not flights:
@@ -94,37 +175,83 @@ async def _search_flights_impl(origin: str, destination: str, date: str = "tomor
             )
 
         result = flight_service.format_flights_list(flights)
-        logger.info(f"✅ Returning {len(flights)} flights for {origin} → {destination}")
+        # Only successful, non-empty results are cached so errors and misses are retried
+        _search_cache_put(cache_key, result)
+        logger.info("✅ Returning %d flights for %s → %s", len(flights), origin, destination)
         return result
 
-    except Exception as e:
-        logger.error(f"❌ Error in search_flights tool: {str(e)}")
-        return f"Sorry, I encountered an error while searching for flights: {str(e)}"
+    except (LookupError, ValueError):
+        # Malformed flight data; anything unexpected propagates to the chat service's tool handler
+        logger.exception("❌ Error in search_flights tool")
+        return "Sorry, I encountered an error while searching for flights. Please try again."
+
+
+async def _search_flights_by_city_impl(
+    origin_city: str, destination_city: str, date: str = "tomorrow"
+) -> str:
+    """Resolve both cities' IATA codes concurrently, then search flights"""
+    logger.info(
+        "🔧 Tool called: search_flights_by_city(%s, %s, %s)", origin_city, destination_city, date
+    )
+
+    origin, destination = await get_iata_service().lookup_many([origin_city, destination_city])
+    return await _search_flights_impl(origin or origin_city, destination or destination_city, date)
+
+
+async def _search_flights_batch_impl(routes: list[FlightSearchInput | dict]) -> str:
+    """Search several routes concurrently and return one section per route"""
+    parsed = [FlightSearchInput.model_validate(route) for route in routes]
+    logger.info("🔧 Tool called: search_flights_batch(%d routes)", len(parsed))
+
+    # One failed route must not take the others' results down with it
+    results = await asyncio.gather(
+        *(_search_flights_impl(r.origin, r.destination, r.date) for r in parsed),
+        return_exceptions=True,
+    )
+    sections = []
+    for r, result in zip(parsed, results, strict=True):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            logger.error(
+                "❌ Error in search_flights_batch for %s → %s",
+                r.origin,
+                r.destination,
+                exc_info=result,
+            )
+            result = "Sorry, I encountered an error while searching this route. Please try again."
+        sections.append(f"### {r.origin} → {r.destination} ({r.date})\n{result}")
+    return "\n\n".join(sections)
+
+
+@lru_cache(maxsize=256)
+def _normalize_flight_number(flight_number: str) -> str:
+    """Canonical flight number with the Air India prefix (" 865" -> "AI865")"""
+    number = flight_number.strip().upper().replace(" ", "")
+    return number if number.startswith("AI") else f"AI{number}"
 
 
 def _get_flight_details_impl(flight_number: str) -> str:
     """Get details for a specific flight"""
-    logger.info(f"🔧 Tool called: get_flight_details({flight_number})")
+    logger.info("🔧 Tool called: get_flight_details(%s)", flight_number)
 
     flight_service = get_flight_service()
 
     try:
         # Normalize flight number (add "AI" prefix if missing)
-        if not flight_number.upper().startswith("AI"):
-            flight_number = f"AI {flight_number}"
-
+        flight_number = _normalize_flight_number(flight_number)
         flight = flight_service.get_flight_by_number(flight_number)
 
         if not flight:
             return f"Flight {flight_number} not found. Please check the flight number."
 
         result = flight_service.format_flight_for_display(flight)
-        logger.info(f"✅ Returning details for flight {flight_number}")
+        logger.info("✅ Returning details for flight %s", flight_number)
         return result
 
-    except Exception as e:
-        logger.error(f"❌ Error in get_flight_details tool: {str(e)}")
-        return f"Sorry, I encountered an error: {str(e)}"
+    except (LookupError, ValueError):
+        logger.exception("❌ Error in get_flight_details tool")
+        return "Sorry, I encountered an error while looking up that flight. Please try again."
 
 
 # ============================================
@@ -132,17 +259,58 @@ def _get_flight_details_impl(flight_number: str) -> str:
 # ============================================
 
 
+_BACKGROUND_LOOP: asyncio.AbstractEventLoop | None = None
+_BACKGROUND_LOOP_LOCK = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Long-lived event loop on a daemon thread, started on first sync tool call"""
+    global _BACKGROUND_LOOP
+    with _BACKGROUND_LOOP_LOCK:
+        if _BACKGROUND_LOOP is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="flight-tools-loop", daemon=True
+            )
+            thread.start()
+            atexit.register(_stop_background_loop, loop, thread)
+            _BACKGROUND_LOOP = loop
+        return _BACKGROUND_LOOP
+
+
+def _stop_background_loop(loop: asyncio.AbstractEventLoop, thread: threading.Thread) -> None:
+    """Stop the background loop at interpreter exit so its selector is released cleanly"""
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=1)
+    if not thread.is_alive():
+        loop.close()
+
+
+def _run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a tool coroutine from sync code (benchmark and non-async contexts)
+
+    Submits to one shared background loop, so it works whether or not the calling
+    thread already runs an event loop, and no loop is created per call.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop()).result()
+
+
 def _search_flights_sync(origin: str, destination: str, date: str = "tomorrow") -> str:
     """Sync wrapper for search_flights (for benchmark and non-async contexts)"""
-    import asyncio
+    return _run_sync(_search_flights_impl(origin, destination, date))
 
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
 
-    return loop.run_until_complete(_search_flights_impl(origin, destination, date))
+def _search_flights_by_city_sync(
+    origin_city: str, destination_city: str, date: str = "tomorrow"
+) -> str:
+    """Sync wrapper for search_flights_by_city"""
+    return _run_sync(_search_flights_by_city_impl(origin_city, destination_city, date))
+
+
+def _search_flights_batch_sync(routes: list[FlightSearchInput | dict]) -> str:
+    """Sync wrapper for search_flights_batch"""
+    return _run_sync(_search_flights_batch_impl(routes))
 
 
 search_flights = StructuredTool.from_function(
@@ -160,6 +328,33 @@ search_flights = StructuredTool.from_function(
     args_schema=FlightSearchInput,  # type: ignore[arg-type]
 )
 
+search_flights_by_city = StructuredTool.from_function(
+    func=_search_flights_by_city_sync,
+    coroutine=_search_flights_by_city_impl,
+    name="search_flights_by_city",
+    description=(
+        "Search for Air India flights using CITY NAMES in any language. "
+        "Resolves both airport codes in parallel and searches in one step - prefer it "
+        "over calling lookup_iata_code twice and then search_flights. "
+        "Dates use 'today', 'tomorrow' or YYYY-MM-DD."
+    ),
+    args_schema=FlightSearchByCityInput,  # type: ignore[arg-type]
+)
+
+search_flights_batch = StructuredTool.from_function(
+    func=_search_flights_batch_sync,
+    coroutine=_search_flights_batch_impl,
+    name="search_flights_batch",
+    description=(
+        "Search several Air India routes at once (searches run in parallel). "
+        "PREFER this over calling search_flights repeatedly whenever one request needs "
+        "two or more independent searches: multi-city itineraries, outbound + return, "
+        "or comparing routes. Each route uses 3-letter IATA codes and YYYY-MM-DD dates, "
+        "exactly like search_flights."
+    ),
+    args_schema=FlightSearchBatchInput,  # type: ignore[arg-type]
+)
+
 get_flight_details = StructuredTool.from_function(
     func=_get_flight_details_impl,
     name="get_flight_details",
@@ -172,4 +367,4 @@ get_flight_details = StructuredTool.from_function(
 
 
 # List of all flight tools
-FLIGHT_TOOLS = [search_flights, get_flight_details]
+FLIGHT_TOOLS = [search_flights, search_flights_by_city, search_flights_batch, get_flight_details]
@@ -36,16 +36,16 @@ def _lookup_iata_code_impl(city_name: str) -> str:
     Returns:
         IATA code information or error message
     """
-    logger.info(f"🔧 Tool called: lookup_iata_code({city_name})")
+    logger.info("🔧 Tool called: lookup_iata_code(%s)", city_name)
 
     service = get_iata_service()
     code = service.lookup(city_name)
 
     if code:
-        logger.info(f"✅ IATA code found: {city_name} → {code}")
+        logger.info("✅ IATA code found: %s → %s", city_name, code)
         return f"The IATA airport code for {city_name} is: {code}"
     else:
-        logger.warning(f"⚠️ IATA code not found: {city_name}")
+        logger.warning("⚠️ IATA code not found: %s", city_name)
         return (
             f"Could not find IATA code for '{city_name}'. "
             "Please verify the city name spelling or try the official airport name."
@@ -4,6 +4,7 @@ Logging configuration for the application.
 Provides structured logging with different levels for development and production.
 """
 
+from functools import cache
 import logging
 import sys
 
@@ -32,15 +33,20 @@ def setup_logging():
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
     logging.getLogger("urllib3").setLevel(logging.WARNING)
+    logging.getLogger("langchain").setLevel(logging.WARNING)
+    logging.getLogger("langchain_core").setLevel(logging.WARNING)
 
     logger = logging.getLogger(__name__)
     logger.info(f"Logging configured: level={log_level}, environment={settings.ENVIRONMENT}")
 
 
+@cache
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a module.
 
+    Cached per name so repeated lookups skip the logging module's lock.
+
     Args:
         name: Module name (usually __name__)
 
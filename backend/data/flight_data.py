@@ -5,6 +5,8 @@ This module contains realistic Air India flight data for demonstration purposes.
 Structure is designed to be easily replaceable with real API data.
 """
 
+import unicodedata
+
 # Airport code mappings (includes common aliases and multilingual names)
 AIRPORT_CODES = {
     # Indian cities - with aliases
@@ -349,18 +351,27 @@ def get_all_flights() -> list[dict]:
     return FLIGHTS_DB
 
 
+def _normalize_city_name(city_name: str) -> str:
+    """Casefold and strip accents so "Dubái", "PARÍS" and "São Paulo" match their keys"""
+    decomposed = unicodedata.normalize("NFKD", city_name.strip())
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+# AIRPORT_CODES keyed by normalized city name, built once at import
+_AIRPORT_CODES_NORMALIZED = {_normalize_city_name(k): v for k, v in AIRPORT_CODES.items()}
+
+
 def get_airport_code(city_name: str) -> str | None:
     """
     Convert city name to airport code.
 
     Args:
-        city_name: City name (e.g., "Delhi", "Mumbai")
+        city_name: City name (e.g., "Delhi", "Mumbai"); case and accents are ignored
 
     Returns:
         Airport code (e.g., "DEL", "BOM") or None if not found
     """
-    normalized = city_name.lower().strip()
-    return AIRPORT_CODES.get(normalized)
+    return _AIRPORT_CODES_NORMALIZED.get(_normalize_city_name(city_name))
 
 
 def normalize_location(location: str) -> str:
@@ -373,8 +384,10 @@ def normalize_location(location: str) -> str:
     Returns:
         Airport code (uppercase)
     """
+    location = location.strip()
+
     # If already an airport code (3 letters)
-    if len(location) == 3 and location.isalpha():
+    if len(location) == 3 and location.isascii() and location.isalpha():
         return location.upper()
 
     # Try to find city in mapping
@@ -6,6 +6,7 @@ These tests DO NOT use any external APIs - safe for CI.
 
 import pytest
 
+from app.services import language_service
 from app.services.language_service import (
     detect_language,
     get_language_instruction,
@@ -48,6 +49,57 @@ class TestLanguageDetection:
         result = detect_language("मुझे कितना सामान ले जाने की अनुमति है?")
         assert result == "hi"
 
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("hola", "es"),
+            ("Gracias", "es"),
+            ("thank you", "en"),
+            ("नमस्ते", "hi"),
+            # Accented keywords must be stored as real UTF-8, not mojibake
+            ("¿Cuánto?", "es"),
+            ("olá", "pt"),
+        ],
+    )
+    def test_short_text_keywords(self, text: str, expected: str):
+        """Test keyword matching for short texts"""
+        assert detect_language(text) == expected
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("ciao", "it"),
+            ("Grazie!", "it"),
+            ("buonasera", "it"),
+            ("danke", "de"),
+            ("guten morgen", "de"),
+            ("bom dia", "pt"),
+            ("boa noite", "pt"),
+        ],
+    )
+    def test_greeting_keywords_skip_lingua(self, monkeypatch, text: str, expected: str):
+        """Common Italian/German/Portuguese greetings resolve from the keyword tables"""
+
+        def no_lingua():
+            raise AssertionError("Lingua should not be needed for keyword hits")
+
+        monkeypatch.setattr(language_service, "_get_detector", no_lingua)
+        language_service._detect_normalized.cache_clear()
+        assert detect_language(text) == expected
+
+    @pytest.mark.parametrize("text", ["Salut", "si", "bonsoir", "servus"])
+    def test_very_short_unmatched_text_is_not_defaulted(self, text: str):
+        """Very short texts with no keyword match go to Lingua instead of the default"""
+        assert detect_language(text, default="en") != "en"
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [("東京に行きたい", "ja"), ("안녕하세요", "ko"), ("Привет, мне нужен рейс", "ru")],
+    )
+    def test_script_detection(self, text: str, expected: str):
+        """Test non-Latin scripts resolve without Lingua"""
+        assert detect_language(text) == expected
+
     def test_empty_text_returns_default(self):
         """Test that empty text returns default language"""
         result = detect_language("", default="en")
@@ -138,6 +138,37 @@ class TestTTLCleanup:
         # Note: The session might still be there but marked for cleanup
         # The important thing is that the service handles this gracefully
 
+    def test_recently_touched_session_survives_cleanup(self):
+        """Test that only sessions idle past the TTL are removed"""
+        service = MemoryService(ttl_minutes=0.005)  # ~0.3 seconds
+
+        service.add_message("idle", "user", "Goes stale")
+        service.add_message("active", "user", "Stays warm")
+        time.sleep(0.2)
+        service.add_message("active", "user", "Still here")
+        time.sleep(0.2)
+
+        service.get_or_create_memory("trigger-cleanup")
+
+        assert "idle" not in service.get_all_session_ids()
+        assert len(service.get_history("active")) == 2
+
+
+class TestSessionCap:
+    """Test LRU eviction when the session cap is reached"""
+
+    def test_least_recently_used_session_is_evicted(self):
+        """Test that the oldest untouched session makes room for a new one"""
+        service = MemoryService(max_sessions=2)
+
+        service.add_message("first", "user", "msg1")
+        service.add_message("second", "user", "msg2")
+        service.add_message("first", "user", "touch first again")
+        service.add_message("third", "user", "msg3")
+
+        assert service.get_session_count() == 2
+        assert set(service.get_all_session_ids()) == {"first", "third"}
+
 
 class TestEdgeCases:
     """Test edge cases and error handling"""
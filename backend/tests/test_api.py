@@ -9,6 +9,8 @@ from fastapi.testclient import TestClient
 import pytest
 
 from app.main import app
+from app.services import llm_manager as llm_manager_module
+from app.services.llm_manager import LLMManager
 
 
 @pytest.fixture
@@ -29,6 +31,17 @@ class TestChatAPI:
         data = response.json()
         assert data["status"] == "ok"
 
+    def test_health_survives_unknown_llm_provider(self, monkeypatch):
+        """A misconfigured LLM_PROVIDER must not stop the app from starting"""
+        monkeypatch.setattr(llm_manager_module, "llm_manager", LLMManager())
+        monkeypatch.setattr(llm_manager_module.settings, "LLM_PROVIDER", "bogus")
+
+        with TestClient(app) as client:
+            response = client.get("/health")
+
+        assert response.status_code == 200
+        assert not llm_manager_module.llm_manager._initialized
+
     def test_ready_endpoint(self, client: TestClient):
         """Test ready endpoint - always ready with Google Embeddings API"""
         response = client.get("/ready")
@@ -0,0 +1,95 @@
+"""
+Tests for ChatService tool execution error handling
+"""
+
+from langchain.tools import StructuredTool
+from langchain_core.messages import AIMessage, ToolMessage
+import pytest
+
+from app.services import chat_service
+from app.services.chat_service import ChatService
+
+SECRET = "amadeus internal: token=abc123"
+
+TOOL_CALL = {"name": "search_flights", "args": {"origin": "DEL"}, "id": "call-1"}
+
+
+def _failing_search(origin: str) -> str:
+    """Raises an exception type the flight tools do not handle themselves"""
+    raise TimeoutError(SECRET)
+
+
+async def _afailing_search(origin: str) -> str:
+    raise TimeoutError(SECRET)
+
+
+FAILING_TOOL = StructuredTool.from_function(
+    func=_failing_search,
+    coroutine=_afailing_search,
+    name="search_flights",
+    description="Search flights",
+)
+
+
+class FakeLLMManager:
+    """Asks for one tool call, then answers; records the messages of every call"""
+
+    provider_name = "fake"
+
+    def __init__(self):
+        self.calls: list[list] = []
+
+    def _respond(self, messages) -> AIMessage:
+        self.calls.append(list(messages))
+        if len(self.calls) == 1:
+            return AIMessage(content="", tool_calls=[TOOL_CALL])
+        return AIMessage(content="Sorry, flight search is unavailable.")
+
+    def invoke(self, messages, temperature=0.3, model_name=None, tools=None):
+        return self._respond(messages)
+
+    async def astream(self, messages, temperature=0.3, tools=None):
+        yield self._respond(messages)
+
+
+@pytest.fixture
+def service(monkeypatch):
+    def _no_vector_service():
+        raise RuntimeError("no database in tests")
+
+    monkeypatch.setattr(chat_service, "get_vector_service", _no_vector_service)
+    fake_llm = FakeLLMManager()
+    monkeypatch.setattr(chat_service, "llm_manager", fake_llm)
+    service = ChatService()
+    service.tools = [FAILING_TOOL]
+    return service, fake_llm
+
+
+def _tool_message(fake_llm: FakeLLMManager) -> ToolMessage:
+    return next(m for m in fake_llm.calls[-1] if isinstance(m, ToolMessage))
+
+
+class TestToolErrors:
+    """Unexpected tool exceptions reach the model as a generic message"""
+
+    def test_process_message_hides_tool_exception(self, service):
+        chat, fake_llm = service
+
+        chat.process_message("tool-error-sync", "Flights from Delhi to Mumbai")
+
+        content = str(_tool_message(fake_llm).content)
+        assert SECRET not in content
+        assert content == chat_service.TOOL_ERROR_MESSAGE.format(tool="search_flights")
+
+    @pytest.mark.asyncio
+    async def test_process_message_stream_hides_tool_exception(self, service):
+        chat, fake_llm = service
+
+        chunks = [
+            c async for c in chat.process_message_stream("tool-error-stream", "Flights to Mumbai")
+        ]
+
+        content = str(_tool_message(fake_llm).content)
+        assert SECRET not in content
+        assert content == chat_service.TOOL_ERROR_MESSAGE.format(tool="search_flights")
+        assert SECRET not in "".join(chunks)
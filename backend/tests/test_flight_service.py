@@ -27,6 +27,10 @@ class TestFlightService:
         assert normalize_location("Delhi") == "DEL"
         assert normalize_location("Mumbai") == "BOM"
 
+        # Case and accents are ignored
+        assert normalize_location("DUBAI") == "DXB"
+        assert normalize_location(" Parìs ") == "CDG"
+
     def test_get_flight_by_number(self):
         """Test getting flight by number"""
         service = FlightService()
@@ -36,6 +40,11 @@ class TestFlightService:
         assert flight is not None
         assert flight.flight_number == "AI 865"
 
+        # Case and spacing variants resolve to the same flight
+        flight = service.get_flight_by_number(" ai865 ")
+        assert flight is not None
+        assert flight.flight_number == "AI 865"
+
         # Test non-existing flight
         flight = service.get_flight_by_number("XX 999")
         assert flight is None
@@ -49,3 +58,15 @@ class TestFlightService:
             formatted = service.format_flight_for_display(flight)
             assert "AI 865" in formatted
             assert "✈️" in formatted
+
+    def test_search_mock_flights_by_route(self):
+        """Test route search returns only that route, ordered by departure"""
+        service = FlightService()
+
+        flights = service._search_mock_flights("DEL", "BOM")
+        assert flights
+        assert all(f.origin == "DEL" and f.destination == "BOM" for f in flights)
+        times = [f.departure_time for f in flights]
+        assert times == sorted(times)
+
+        assert service._search_mock_flights("DEL", "XXX") == []
@@ -0,0 +1,181 @@
+"""
+Tests for the flight tools (batch search, result cache, city search)
+"""
+
+import threading
+from types import SimpleNamespace
+
+from pydantic import ValidationError
+import pytest
+
+from app.services.amadeus_api import AmadeusFlightAPI
+from app.services.flight_service import FlightService
+from app.services.iata_service import IATAService
+from app.tools import flight_tools
+
+
+@pytest.fixture(autouse=True)
+def clear_search_cache():
+    """Each test starts with an empty search result cache"""
+    flight_tools._SEARCH_CACHE.clear()
+    yield
+    flight_tools._SEARCH_CACHE.clear()
+
+
+@pytest.fixture
+def mock_flight_service(monkeypatch):
+    """FlightService on mock data only"""
+    service = FlightService()
+    service.use_real_api = False
+    monkeypatch.setattr(flight_tools, "get_flight_service", lambda: service)
+    return service
+
+
+class TestSearchFlightsBatch:
+    """search_flights_batch runs its searches concurrently"""
+
+    @pytest.mark.asyncio
+    async def test_batch_overlaps_amadeus_calls(self, mock_flight_service):
+        routes = [("DEL", "BOM"), ("DEL", "BLR"), ("BOM", "DEL")]
+        # Every SDK call blocks until all of them are in flight, so this only
+        # completes if the blocking calls overlap
+        barrier = threading.Barrier(len(routes), timeout=5)
+        overlapped: list[str] = []
+
+        def blocking_get(**kwargs):
+            barrier.wait()
+            overlapped.append(kwargs["originLocationCode"])
+            return SimpleNamespace(data=[])
+
+        amadeus = AmadeusFlightAPI()
+        amadeus.client = SimpleNamespace(  # type: ignore[assignment]
+            shopping=SimpleNamespace(flight_offers_search=SimpleNamespace(get=blocking_get))
+        )
+        mock_flight_service.amadeus_api = amadeus
+        mock_flight_service.use_real_api = True
+
+        result = await flight_tools._search_flights_batch_impl(
+            [{"origin": o, "destination": d, "date": "any"} for o, d in routes]
+        )
+
+        assert len(overlapped) == len(routes)
+        for origin, destination in routes:
+            assert f"### {origin} → {destination} (any)" in result
+
+    @pytest.mark.asyncio
+    async def test_failed_route_keeps_other_results(self, mock_flight_service, monkeypatch):
+        search = mock_flight_service.search_flights
+
+        async def failing_search(**kwargs):
+            if kwargs["origin"] == "BOM":
+                raise RuntimeError("connection reset")
+            return await search(**kwargs)
+
+        monkeypatch.setattr(mock_flight_service, "search_flights", failing_search)
+
+        result = await flight_tools._search_flights_batch_impl(
+            [{"origin": "DEL", "destination": "BOM"}, {"origin": "BOM", "destination": "DEL"}]
+        )
+
+        delhi, mumbai = result.split("\n\n### ")
+        assert "AI " in delhi
+        assert mumbai.startswith("BOM → DEL")
+        assert "error while searching this route" in mumbai
+        assert "connection reset" not in result
+
+    def test_schema_requires_two_routes(self):
+        with pytest.raises(ValidationError):
+            flight_tools.FlightSearchBatchInput.model_validate(
+                {"routes": [{"origin": "DEL", "destination": "BOM"}]}
+            )
+
+
+@pytest.fixture
+def search_calls(mock_flight_service, monkeypatch) -> list[dict]:
+    """Records every search that reaches FlightService (i.e. every cache miss)"""
+    calls: list[dict] = []
+    search = mock_flight_service.search_flights
+
+    async def counting_search(**kwargs):
+        calls.append(kwargs)
+        return await search(**kwargs)
+
+    monkeypatch.setattr(mock_flight_service, "search_flights", counting_search)
+    return calls
+
+
+class TestSearchCache:
+    """Formatted search results are cached per (origin, destination, date) for a TTL"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_search_hits_cache(self, search_calls):
+        first = await flight_tools._search_flights_impl("DEL", "BOM", "2025-01-15")
+        second = await flight_tools._search_flights_impl("DEL", "BOM", "2025-01-15")
+
+        assert second == first
+        assert len(search_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_city_name_and_code_share_entry(self, search_calls):
+        await flight_tools._search_flights_impl("Delhi", "Mumbai", "2025-01-15")
+        await flight_tools._search_flights_impl("DEL", "BOM", "2025-01-15")
+
+        assert len(search_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_searched_again(self, search_calls, monkeypatch):
+        now = [1000.0]
+        # Fake clock for the cache only (the event loop keeps the real one)
+        monkeypatch.setattr(flight_tools, "time", SimpleNamespace(monotonic=lambda: now[0]))
+
+        await flight_tools._search_flights_impl("DEL", "BOM", "2025-01-15")
+        now[0] += flight_tools.SEARCH_CACHE_TTL - 1
+        await flight_tools._search_flights_impl("DEL", "BOM", "2025-01-15")
+        assert len(search_calls) == 1
+
+        now[0] += 2
+        await flight_tools._search_flights_impl("DEL", "BOM", "2025-01-15")
+        assert len(search_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_date_wildcards_share_unfiltered_entry(self, search_calls):
+        for date in ("any", "tomorrow"):
+            await flight_tools._search_flights_impl("DEL", "BOM", date)
+
+        assert len(search_calls) == 1
+        assert search_calls[0]["date"] is None
+
+    @pytest.mark.asyncio
+    async def test_empty_result_is_not_cached(self, search_calls):
+        await flight_tools._search_flights_impl("DEL", "XYZ", "2025-01-15")
+        await flight_tools._search_flights_impl("DEL", "XYZ", "2025-01-15")
+
+        assert len(search_calls) == 2
+
+
+@pytest.fixture
+def local_iata_service(monkeypatch) -> IATAService:
+    """IATAService restricted to the built-in database"""
+    service = IATAService()
+    service._amadeus_client = None
+    monkeypatch.setattr(flight_tools, "get_iata_service", lambda: service)
+    return service
+
+
+class TestSearchFlightsByCity:
+    """search_flights_by_city resolves city names before searching"""
+
+    @pytest.mark.asyncio
+    async def test_resolves_cities_to_codes(self, search_calls, local_iata_service):
+        result = await flight_tools._search_flights_by_city_impl("Nueva Delhi", "Bombay", "any")
+
+        assert search_calls[0]["origin"] == "DEL"
+        assert search_calls[0]["destination"] == "BOM"
+        assert "AI " in result
+
+    @pytest.mark.asyncio
+    async def test_unknown_city_is_searched_as_given(self, search_calls, local_iata_service):
+        result = await flight_tools._search_flights_by_city_impl("Atlantis", "Mumbai", "any")
+
+        assert search_calls[0]["origin"] == "Atlantis"
+        assert result.startswith("No Air India flights found from Atlantis")
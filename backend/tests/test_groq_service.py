@@ -0,0 +1,126 @@
+"""
+Tests for the Groq provider (streaming retries, opt-in prompt cache)
+"""
+
+import inspect
+
+import groq
+import httpx
+from langchain_core.caches import InMemoryCache
+from langchain_core.messages import AIMessageChunk, HumanMessage
+import pytest
+
+from app.core.config import Settings
+from app.services import groq_service
+from app.services.groq_service import GroqProvider, GroqServiceError
+
+
+def _rate_limit_error() -> groq.RateLimitError:
+    request = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+    return groq.RateLimitError(
+        "rate limited", response=httpx.Response(429, request=request), body=None
+    )
+
+
+class FakeStreamingLLM:
+    """Stands in for ChatGroq: the first `failures` streams raise before any chunk"""
+
+    def __init__(self, model_name: str, failures: int):
+        self.model_name = model_name
+        self.failures = failures
+        self.calls = 0
+
+    async def astream(self, messages):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise _rate_limit_error()
+        yield AIMessageChunk(content="Hello")
+        yield AIMessageChunk(content=" there")
+
+
+def _patch_llms(monkeypatch, llms: dict[str, FakeStreamingLLM]) -> None:
+    pool = list(llms)
+    monkeypatch.setattr(groq_service.settings, "GROQ_MODEL_POOL", pool)
+    monkeypatch.setattr(
+        groq_service,
+        "get_groq_llm",
+        lambda temperature=0.3, max_tokens=None, model_name=None: llms[model_name or pool[0]],
+    )
+    monkeypatch.setattr(groq_service, "_backoff_delay", lambda attempt: 0)
+
+
+async def _collect(provider: GroqProvider) -> str:
+    chunks = [chunk async for chunk in provider.astream([HumanMessage(content="hi")])]
+    return "".join(str(chunk.content) for chunk in chunks)
+
+
+class TestGroqStreaming:
+    """Stream start gets backoff and model fallback like invoke"""
+
+    @pytest.mark.asyncio
+    async def test_astream_retries_rate_limit(self, monkeypatch):
+        llm = FakeStreamingLLM("model-a", failures=1)
+        _patch_llms(monkeypatch, {"model-a": llm})
+
+        assert await _collect(GroqProvider()) == "Hello there"
+        assert llm.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_astream_falls_back_to_next_model(self, monkeypatch):
+        primary = FakeStreamingLLM("model-a", failures=groq_service.RETRY_ATTEMPTS)
+        backup = FakeStreamingLLM("model-b", failures=0)
+        _patch_llms(monkeypatch, {"model-a": primary, "model-b": backup})
+        provider = GroqProvider()
+
+        assert await _collect(provider) == "Hello there"
+        assert primary.calls == groq_service.RETRY_ATTEMPTS
+        assert provider._healthy_model == "model-b"
+
+    @pytest.mark.asyncio
+    async def test_astream_passes_stream_through_after_first_chunk(self, monkeypatch):
+        llm = FakeStreamingLLM("model-a", failures=0)
+        _patch_llms(monkeypatch, {"model-a": llm})
+
+        stream = GroqProvider().astream([HumanMessage(content="hi")])
+        assert not inspect.isasyncgen(stream)
+
+        first = await anext(stream)
+        underlying = stream._stream
+        assert inspect.isasyncgen(underlying)
+        assert first.content == "Hello"
+        assert (await anext(stream)).content == " there"
+        assert stream._stream is underlying
+
+    @pytest.mark.asyncio
+    async def test_astream_raises_when_all_models_fail(self, monkeypatch):
+        llm = FakeStreamingLLM("model-a", failures=groq_service.RETRY_ATTEMPTS)
+        _patch_llms(monkeypatch, {"model-a": llm})
+
+        with pytest.raises(GroqServiceError):
+            await _collect(GroqProvider())
+
+
+class TestPromptCache:
+    """The exact prompt cache is only attached when ENABLE_LLM_CACHE is on"""
+
+    def test_disabled_by_default(self):
+        assert Settings.model_fields["ENABLE_LLM_CACHE"].default is False
+
+    def test_not_built_when_flag_off(self, monkeypatch):
+        monkeypatch.setattr(groq_service.settings, "ENABLE_LLM_CACHE", False)
+        assert groq_service._build_prompt_cache() is None
+
+    def test_built_when_flag_on(self, monkeypatch):
+        monkeypatch.setattr(groq_service.settings, "ENABLE_LLM_CACHE", True)
+        assert isinstance(groq_service._build_prompt_cache(), InMemoryCache)
+
+    @pytest.mark.parametrize("enabled", [False, True])
+    def test_llm_uses_cache_only_when_enabled(self, monkeypatch, enabled: bool):
+        monkeypatch.setattr(groq_service.settings, "ENABLE_LLM_CACHE", enabled)
+        monkeypatch.setattr(groq_service.settings, "GROQ_API_KEY", "test-key")
+        monkeypatch.setattr(groq_service, "_PROMPT_CACHE", groq_service._build_prompt_cache())
+        monkeypatch.setattr(groq_service, "_LLM_CACHE", {})
+
+        llm = groq_service.get_groq_llm(model_name="llama-3.3-70b-versatile")
+
+        assert (llm.cache is not None) is enabled
@@ -0,0 +1,81 @@
+"""
+Tests for IATAService lookups (local database, fake Amadeus client)
+"""
+
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import iata_service
+from app.services.iata_service import IATAService
+
+
+@pytest.fixture
+def service() -> IATAService:
+    service = IATAService()
+    service._amadeus_client = None
+    return service
+
+
+class TestLookup:
+    """Single-city lookups against the local database"""
+
+    def test_literal_iata_code_is_accepted(self, service):
+        assert service.lookup("jfk") == "JFK"
+
+    @pytest.mark.parametrize("name", ["東京都", "Рим", "ñoñ"])
+    def test_non_ascii_three_letter_name_is_not_a_code(self, service, name: str):
+        assert service.lookup(name) is None
+
+
+class FakeLocations:
+    """Amadeus reference_data.locations stand-in that knows one city"""
+
+    def __init__(self):
+        self.keywords: list[str] = []
+
+    def get(self, keyword: str, subType: str):
+        self.keywords.append(keyword)
+        data = [{"iataCode": "ATL"}] if keyword.strip().lower() == "atlantis" else []
+        return SimpleNamespace(data=data)
+
+
+@pytest.fixture
+def amadeus_locations(service, monkeypatch) -> FakeLocations:
+    locations = FakeLocations()
+    service._amadeus_client = SimpleNamespace(reference_data=SimpleNamespace(locations=locations))
+    # Keep Amadeus results from leaking into the process-wide caches
+    monkeypatch.setattr(iata_service, "_AMADEUS_CACHE", OrderedDict())
+    monkeypatch.setattr(iata_service, "_IATA_REVERSE", dict(iata_service._IATA_REVERSE))
+    return locations
+
+
+class TestLookupMany:
+    """Batch lookups keep input order and query Amadeus once per unknown city"""
+
+    @pytest.mark.asyncio
+    async def test_local_cities_without_amadeus(self, service):
+        codes = await service.lookup_many(["Delhi", "Mumbai", "Atlantis", ""])
+
+        assert codes == ["DEL", "BOM", None, None]
+
+    @pytest.mark.asyncio
+    async def test_misses_are_deduplicated(self, service, amadeus_locations):
+        codes = await service.lookup_many(["Delhi", "Atlantis", "atlantis ", "Nowhere"])
+
+        assert codes == ["DEL", "ATL", "ATL", None]
+        assert sorted(amadeus_locations.keywords) == ["Atlantis", "Nowhere"]
+
+
+class TestAmadeusCache:
+    """Amadeus results are evicted least recently used first"""
+
+    def test_hit_protects_entry_from_eviction(self, service, amadeus_locations, monkeypatch):
+        monkeypatch.setattr(iata_service, "AMADEUS_CACHE_SIZE", 2)
+        iata_service._AMADEUS_CACHE.update({"old town": "OLD", "new town": "NEW"})
+
+        assert service.lookup("Old Town") == "OLD"
+        assert service.lookup("Atlantis") == "ATL"
+
+        assert list(iata_service._AMADEUS_CACHE) == ["old town", "atlantis"]
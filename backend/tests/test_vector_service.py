@@ -0,0 +1,98 @@
+"""
+Tests for VectorService ingestion accounting (no database or embeddings API)
+"""
+
+import logging
+
+from langchain_core.documents import Document
+import pytest
+
+from app.scripts import ingest_data
+from app.services.vector_service import IngestResult, VectorService
+
+
+class FakeVectorStore:
+    """Records stored batches; batches containing a "bad" chunk fail"""
+
+    def __init__(self):
+        self.stored: list[list[Document]] = []
+
+    def add_documents(self, batch: list[Document]) -> None:
+        if any(doc.page_content == "bad" for doc in batch):
+            raise ValueError("invalid document")
+        self.stored.append(batch)
+
+
+BATCHES = [
+    [Document(page_content="a"), Document(page_content="b")],
+    [Document(page_content="bad"), Document(page_content="c")],
+    [Document(page_content="d")],
+]
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = VectorService.__new__(VectorService)
+    service.vector_store = FakeVectorStore()
+    monkeypatch.setattr(service, "_iter_batches", lambda directory_path: iter(BATCHES))
+    return service
+
+
+class TestIngestAccounting:
+    """Failed batches are not counted as stored"""
+
+    def test_ingest_data_counts_only_stored_chunks(self, service, caplog):
+        assert service.ingest_data("policies") == IngestResult(3, 5, [2])
+        assert len(service.vector_store.stored) == 2
+        assert "1 batch(es) failed: [2]" in caplog.text
+        assert "Ingestion complete" not in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_aingest_data_counts_only_stored_chunks(self, service, caplog):
+        assert await service.aingest_data("policies", concurrency=2) == IngestResult(3, 5, [2])
+        assert len(service.vector_store.stored) == 2
+        assert "1 batch(es) failed: [2]" in caplog.text
+        assert "Ingestion complete" not in caplog.text
+
+
+class TestIterBatches:
+    """Ingestion streams the knowledge base file by file"""
+
+    def test_files_are_loaded_sequentially(self, tmp_path, monkeypatch):
+        for name in ("a.md", "b.md"):
+            (tmp_path / name).write_text(f"# {name}", encoding="utf-8")
+        service = VectorService.__new__(VectorService)
+        loaders = []
+        directory_loader = service._directory_loader
+
+        def recording_loader(directory_path, threaded=True):
+            loaders.append(directory_loader(directory_path, threaded=threaded))
+            return loaders[-1]
+
+        monkeypatch.setattr(service, "_directory_loader", recording_loader)
+
+        batches = list(service._iter_batches(str(tmp_path)))
+
+        assert not loaders[0].use_multithreading
+        assert sorted(doc.page_content for doc in batches[0]) == ["# a.md", "# b.md"]
+
+
+class TestIngestScript:
+    """The ingest script fails when not every chunk was stored"""
+
+    @pytest.mark.asyncio
+    async def test_main_raises_on_failed_batches(self, service, monkeypatch, caplog):
+        monkeypatch.setattr(ingest_data, "VectorService", lambda: service)
+
+        with pytest.raises(RuntimeError, match=r"3/5 chunks stored"):
+            await ingest_data.main()
+        assert "finished successfully" not in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_main_succeeds_when_all_batches_stored(self, service, monkeypatch, caplog):
+        monkeypatch.setattr(service, "_iter_batches", lambda directory_path: iter(BATCHES[::2]))
+        monkeypatch.setattr(ingest_data, "VectorService", lambda: service)
+        caplog.set_level(logging.INFO)
+
+        await ingest_data.main()
+        assert "finished successfully" in caplog.text